@@ -9,20 +9,141 @@ Provides endpoints for:
 - Adaptive learning updates
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+import numpy as np
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+import itertools
 import sys
 import os
+import torch
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from engine.advanced_falsifier import AdvancedFalsifier
 
 # Initialize router
-router = APIRouter(prefix="/advanced", tags=["Advanced ML"])
+router = APIRouter(prefix="/advanced", tags=["Advanced ML"],
+                   default_response_class=ORJSONResponse)
 
-# Initialize advanced falsifier
-advanced_falsifier = AdvancedFalsifier()
+# ============================================================================
+# Sharded Falsifier Pool
+# ============================================================================
+
+# K independent replicas so concurrent requests don't contend on one model
+# instance; inference calls round-robin across the pool and run in a thread
+# pool (PyTorch releases the GIL inside forward). The pool is built lazily
+# on first request so importing this module (worker boot) doesn't pay the
+# model-load cost up front.
+POOL_SIZE = min(max((os.cpu_count() or 4) // 4, 1), 8)
+FALSIFIER_POOL: List[AdvancedFalsifier] = []
+_pool_cycle = None
+_pool_lock = asyncio.Lock()
+_pool_executor = ThreadPoolExecutor(max_workers=POOL_SIZE)
+
+async def get_falsifier_pool() -> List[AdvancedFalsifier]:
+    """Build the replica pool on first use, off the event loop."""
+    global FALSIFIER_POOL, _pool_cycle
+    # Gate on _pool_cycle, the last thing published: the build suspends at
+    # every await, so a request landing mid-build must take the slow path
+    # and wait on the lock rather than see a half-built pool.
+    if _pool_cycle is None:
+        async with _pool_lock:
+            if _pool_cycle is None:
+                # POOL_SIZE replicas already run forwards concurrently (and
+                # uvicorn runs one worker per core) — intra-op threads on
+                # top of that just oversubscribe, so pin torch to one.
+                torch.set_num_threads(1)
+                loop = asyncio.get_event_loop()
+                replicas = []
+                for _ in range(POOL_SIZE):
+                    replicas.append(
+                        await loop.run_in_executor(_pool_executor, AdvancedFalsifier)
+                    )
+                FALSIFIER_POOL = replicas
+                _pool_cycle = itertools.cycle(replicas)
+    return FALSIFIER_POOL
+
+async def get_primary() -> AdvancedFalsifier:
+    """Primary instance: stateful operations (adaptive updates, status) stay
+    here so online-learning weight updates don't diverge across replicas."""
+    return (await get_falsifier_pool())[0]
+
+async def run_sharded(method_name: str, *args, **kwargs):
+    """Dispatch an inference call to the next pool replica off the event loop."""
+    await get_falsifier_pool()
+    falsifier = next(_pool_cycle)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        _pool_executor, partial(getattr(falsifier, method_name), *args, **kwargs)
+    )
+
+# ============================================================================
+# Dynamic Request Batching
+# ============================================================================
+
+# Opt-in: collate concurrent /comprehensive requests into one batched forward
+ENABLE_DYNAMIC_BATCH = os.getenv("ENABLE_DYNAMIC_BATCH") == "1"
+
+class RequestBatcher:
+    """
+    Accumulate concurrent comprehensive-analysis requests over a short window
+    and run them through one batched model forward pass, then scatter results
+    back to the waiting callers.
+    """
+    def __init__(self, max_batch: int = 32, max_wait: float = 0.01):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task = None
+
+    async def submit(self, returns, macro_indicators, news_texts) -> Dict[str, Any]:
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        await self.queue.put((returns, macro_indicators, news_texts, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.ensure_future(self._drain())
+        return await future
+
+    async def _drain(self):
+        loop = asyncio.get_event_loop()
+        while not self.queue.empty():
+            items = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(items) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                primary = await get_primary()
+                # Off the event loop, like every other forward: run inline
+                # it would stall request handling (and the next batch's
+                # accumulation) for the whole batched pass
+                batch_results = await loop.run_in_executor(
+                    _pool_executor,
+                    partial(
+                        primary.comprehensive_analysis_batch,
+                        [item[0] for item in items],
+                        [item[1] for item in items],
+                        [item[2] for item in items],
+                    ),
+                )
+                for (_, _, _, future), result in zip(items, batch_results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                for _, _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+
+batcher = RequestBatcher()
 
 # ============================================================================
 # Request/Response Models
@@ -33,14 +154,6 @@ class ComprehensiveAnalysisRequest(BaseModel):
     macro_indicators: Optional[Dict[str, float]] = None
     news_texts: Optional[List[str]] = None
 
-class ComprehensiveAnalysisResponse(BaseModel):
-    future_failure_prob: float
-    complex_pattern_prob: float
-    anomaly: Dict[str, Any]
-    news_sentiment: Optional[Dict[str, Any]] = None
-    combined_risk_score: float
-    recommendation: str
-
 class AdaptiveUpdateRequest(BaseModel):
     returns: List[float]
     actual_failure: bool
@@ -49,7 +162,7 @@ class AdaptiveUpdateRequest(BaseModel):
 # Endpoints
 # ============================================================================
 
-@router.post("/comprehensive", response_model=ComprehensiveAnalysisResponse)
+@router.post("/comprehensive")
 async def comprehensive_analysis(request: ComprehensiveAnalysisRequest):
     """
     Perform comprehensive analysis using all ML models.
@@ -63,20 +176,34 @@ async def comprehensive_analysis(request: ComprehensiveAnalysisRequest):
     - Actionable recommendation
     """
     try:
-        results = advanced_falsifier.comprehensive_analysis(
-            returns=request.returns,
-            macro_indicators=request.macro_indicators,
-            news_texts=request.news_texts
-        )
-        
-        return ComprehensiveAnalysisResponse(
-            future_failure_prob=results['future_failure_prob'],
-            complex_pattern_prob=results['complex_pattern_prob'],
-            anomaly=results['anomaly'],
-            news_sentiment=results.get('news_sentiment'),
-            combined_risk_score=results['combined_risk_score'],
-            recommendation=results['recommendation']
-        )
+        if ENABLE_DYNAMIC_BATCH:
+            results = await batcher.submit(
+                request.returns, request.macro_indicators, request.news_texts
+            )
+        else:
+            # The four sub-models are independent — schedule their forwards
+            # concurrently across pool replicas and combine at the end
+            futures = [
+                run_sharded('predict_future_failure',
+                            request.returns, request.macro_indicators),
+                run_sharded('detect_complex_patterns',
+                            request.returns, request.macro_indicators),
+                run_sharded('check_anomaly', request.returns),
+            ]
+            if request.news_texts:
+                futures.append(run_sharded('analyze_news_impact', request.news_texts))
+
+            outputs = await asyncio.gather(*futures)
+            news_sentiment = outputs[3] if request.news_texts else None
+
+            primary = await get_primary()
+            results = primary.combine_analysis(
+                outputs[0], outputs[1], outputs[2], news_sentiment
+            )
+
+        # Return the result dict directly (like the sibling endpoints) so the
+        # response skips a second round-trip through Pydantic validation.
+        return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -84,7 +211,8 @@ async def comprehensive_analysis(request: ComprehensiveAnalysisRequest):
 async def predict_future_failure(request: ComprehensiveAnalysisRequest):
     """Predict future failure probability using LSTM."""
     try:
-        prob = advanced_falsifier.predict_future_failure(
+        prob = await run_sharded(
+            'predict_future_failure',
             returns=request.returns,
             macro_indicators=request.macro_indicators
         )
@@ -96,7 +224,28 @@ async def predict_future_failure(request: ComprehensiveAnalysisRequest):
 async def detect_anomaly(returns: List[float]):
     """Detect if current pattern is anomalous."""
     try:
-        is_anomaly, score, description = advanced_falsifier.check_anomaly(returns)
+        is_anomaly, score, description = await run_sharded('check_anomaly', returns)
+        return {
+            "is_anomaly": is_anomaly,
+            "anomaly_score": score,
+            "description": description
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/detect-anomaly-bin")
+async def detect_anomaly_bin(request: Request):
+    """
+    Binary variant of /detect-anomaly for large return series.
+
+    Accepts a raw application/octet-stream body of little-endian float32
+    values — one memcpy via np.frombuffer instead of parsing a JSON array
+    of floats through Pydantic.
+    """
+    try:
+        raw = await request.body()
+        returns = np.frombuffer(raw, dtype='<f4').astype(np.float64).tolist()
+        is_anomaly, score, description = await run_sharded('check_anomaly', returns)
         return {
             "is_anomaly": is_anomaly,
             "anomaly_score": score,
@@ -109,7 +258,7 @@ async def detect_anomaly(returns: List[float]):
 async def analyze_news(news_texts: List[str]):
     """Analyze news sentiment and market impact."""
     try:
-        results = advanced_falsifier.analyze_news_impact(news_texts)
+        results = await run_sharded('analyze_news_impact', news_texts)
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -118,7 +267,8 @@ async def analyze_news(news_texts: List[str]):
 async def adaptive_update(request: AdaptiveUpdateRequest):
     """Update models with new data (online learning)."""
     try:
-        advanced_falsifier.adaptive_update(
+        primary = await get_primary()
+        primary.adaptive_update(
             returns=request.returns,
             actual_failure=request.actual_failure
         )
@@ -129,10 +279,11 @@ async def adaptive_update(request: AdaptiveUpdateRequest):
 @router.get("/status")
 async def get_status():
     """Get status of all ML models."""
+    if not FALSIFIER_POOL:
+        return {"status": "not_loaded"}
+    primary = FALSIFIER_POOL[0]
     return {
-        "lstm_loaded": hasattr(advanced_falsifier.lstm_predictor, 'lstm'),
-        "pattern_detector_loaded": hasattr(advanced_falsifier.pattern_detector, 'network'),
-        "anomaly_detector_fitted": advanced_falsifier.anomaly_detector.is_fitted,
-        "model_dir": str(advanced_falsifier.model_dir),
+        **primary._status,
+        "anomaly_detector_fitted": primary.anomaly_detector.is_fitted,
         "status": "operational"
     }
@@ -1,8 +1,12 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Float, DateTime, JSON
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, Float, DateTime, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
 
+# Binary JSONB on Postgres (no text re-parse on read); plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 class User(Base):
     __tablename__ = "users"
 
@@ -15,6 +19,8 @@ class User(Base):
 
 class DbSimulationResult(Base):
     __tablename__ = "simulation_results"
+    # Per-user history ("my recent simulations") is the common query shape
+    __table_args__ = (Index('ix_sim_owner_created', 'owner_id', 'created_at'),)
 
     id = Column(Integer, primary_key=True, index=True)
     simulation_uuid = Column(String, index=True)
@@ -28,10 +34,10 @@ class DbSimulationResult(Base):
     falsification_triggered = Column(Boolean, default=False)
     falsification_reason = Column(String, nullable=True)
     
-    # Store complex nested data as JSON
-    trades_json = Column(JSON)
-    equity_curve_json = Column(JSON)
-    warnings_json = Column(JSON)
+    # Store complex nested data as JSON (JSONB on Postgres)
+    trades_json = Column(JSONVariant)
+    equity_curve_json = Column(JSONVariant)
+    warnings_json = Column(JSONVariant)
     
     owner_id = Column(Integer, ForeignKey("users.id"))
     owner = relationship("User", back_populates="simulations")
@@ -1,11 +1,31 @@
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, StringConstraints
+from typing import Annotated, List, Optional, Dict, Any
+
+from security.validator import TICKER_PATTERN
+
+# Same allowlist as security.validator; running it inside pydantic-core
+# means bad tickers are rejected during request parsing
+Ticker = Annotated[str, StringConstraints(pattern=TICKER_PATTERN)]
+
+__all__ = [
+    "IndicatorConfig",
+    "Rule",
+    "StrategyRequest",
+    "Trade",
+    "BacktestResponse",
+    "AnalysisResponse",
+    "CombinedResponse",
+]
 
 class IndicatorConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     params: Dict[str, Any]
 
 class Rule(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: str  # 'buy' or 'sell'
     condition: str  # 'threshold', 'crossover', 'crossunder'
     indicator: Optional[str] = None
@@ -15,7 +35,9 @@ class Rule(BaseModel):
     ind2: Optional[str] = None
 
 class StrategyRequest(BaseModel):
-    ticker: str
+    model_config = ConfigDict(frozen=True)
+
+    ticker: Ticker
     start_date: Optional[str] = "2023-01-01"
     end_date: Optional[str] = "2023-04-01"
     initial_capital: float = 10000.0
@@ -29,9 +51,13 @@ class Trade(BaseModel):
 
 class BacktestResponse(BaseModel):
     final_capital: float
-    trades: List[Dict[str, Any]]
+    # Columnar (SoA) trades: {"dates": [...], "types": [...], "prices": [...]}
+    trades: Dict[str, List[Any]]
     equity_curve: List[float]
 
 class AnalysisResponse(BaseModel):
     failure_probability: float
     recommendation: str
+
+class CombinedResponse(BacktestResponse):
+    analysis: Optional[AnalysisResponse] = None
@@ -6,19 +6,30 @@ from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
-import json
+import orjson
 import asyncio
+import time
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from engine.realtime_simulator import RealtimeSimulator
-from engine.strategy import Strategy, SMA, RSI, MACD
 from backend.models import IndicatorConfig, Rule
+from backend.strategy_builder import build_strategy
 
 router = APIRouter(prefix="/simulation", tags=["Real-Time Simulation"])
 
+# Pre-encoded SSE framing; frames are yielded as bytes (StreamingResponse
+# accepts them) so orjson's output never round-trips through str.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+def _sse_frame(payload) -> bytes:
+    return _SSE_PREFIX + orjson.dumps(
+        payload, option=orjson.OPT_SERIALIZE_NUMPY
+    ) + _SSE_SUFFIX
+
 class SimulationRequest(BaseModel):
     ticker: str
     indicators: List[IndicatorConfig]
@@ -30,21 +41,13 @@ class SimulationRequest(BaseModel):
 async def get_simulation_info(request: SimulationRequest):
     """Get information about the simulation period."""
     try:
-        # Build strategy
-        indicators = []
-        for ind_config in request.indicators:
-            if ind_config.name == "SMA":
-                indicators.append(SMA("SMA", ind_config.params))
-            elif ind_config.name == "RSI":
-                indicators.append(RSI("RSI", ind_config.params))
-            elif ind_config.name == "MACD":
-                indicators.append(MACD("MACD", ind_config.params))
-        
-        rules_dict = [rule.dict() for rule in request.rules]
-        strategy = Strategy(indicators, rules_dict)
+        # Build strategy (memoized across requests)
+        strategy = build_strategy(request.indicators, request.rules)
         simulator = RealtimeSimulator(request.ticker, strategy, request.initial_capital)
         
         return simulator.get_simulation_info()
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -56,35 +59,38 @@ async def stream_simulation(request: SimulationRequest):
     """
     async def event_generator():
         try:
-            # Build strategy
-            indicators = []
-            for ind_config in request.indicators:
-                if ind_config.name == "SMA":
-                    indicators.append(SMA("SMA", ind_config.params))
-                elif ind_config.name == "RSI":
-                    indicators.append(RSI("RSI", ind_config.params))
-                elif ind_config.name == "MACD":
-                    indicators.append(MACD("MACD", ind_config.params))
-            
-            rules_dict = [rule.dict() for rule in request.rules]
-            strategy = Strategy(indicators, rules_dict)
+            # Build strategy (memoized across requests)
+            strategy = build_strategy(request.indicators, request.rules)
             simulator = RealtimeSimulator(request.ticker, strategy, request.initial_capital)
             
             # Send initial info
             info = simulator.get_simulation_info()
-            yield f"data: {json.dumps({'type': 'info', 'data': info})}\n\n"
+            yield _sse_frame({'type': 'info', 'data': info})
             
-            # Stream simulation updates
+            # Stream simulation updates, coalescing several days into one
+            # frame at high playback speeds so the socket write and event-loop
+            # wakeup cost doesn't scale 1:1 with simulated days.
+            batch = max(1, int(request.speed / 10))
+            buf = []
+            last_flush = time.monotonic()
             for state in simulator.run_full_simulation():
-                yield f"data: {json.dumps({'type': 'update', 'data': state})}\n\n"
-                await asyncio.sleep(1 / request.speed)
+                buf.append(state)
+                if len(buf) >= batch or time.monotonic() - last_flush >= 0.1:
+                    yield _sse_frame({'type': 'updates', 'data': buf})
+                    # One wakeup per flushed batch instead of one per day:
+                    # playback pace is preserved, loop overhead drops batch-fold
+                    await asyncio.sleep(len(buf) / request.speed)
+                    buf = []
+                    last_flush = time.monotonic()
+            if buf:
+                yield _sse_frame({'type': 'updates', 'data': buf})
             
             # Send final results
             results = simulator.get_final_results()
-            yield f"data: {json.dumps({'type': 'complete', 'data': results})}\n\n"
+            yield _sse_frame({'type': 'complete', 'data': results})
             
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse_frame({'type': 'error', 'message': str(e)})
     
     return StreamingResponse(
         event_generator(),
@@ -102,18 +108,8 @@ async def run_simulation(request: SimulationRequest):
     Use this for non-streaming mode.
     """
     try:
-        # Build strategy
-        indicators = []
-        for ind_config in request.indicators:
-            if ind_config.name == "SMA":
-                indicators.append(SMA("SMA", ind_config.params))
-            elif ind_config.name == "RSI":
-                indicators.append(RSI("RSI", ind_config.params))
-            elif ind_config.name == "MACD":
-                indicators.append(MACD("MACD", ind_config.params))
-        
-        rules_dict = [rule.dict() for rule in request.rules]
-        strategy = Strategy(indicators, rules_dict)
+        # Build strategy (memoized across requests)
+        strategy = build_strategy(request.indicators, request.rules)
         simulator = RealtimeSimulator(request.ticker, strategy, request.initial_capital)
         
         # Run full simulation
@@ -129,5 +125,7 @@ async def run_simulation(request: SimulationRequest):
             'states': states,
             'results': results
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
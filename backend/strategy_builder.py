@@ -0,0 +1,48 @@
+"""
+Shared, memoized Strategy construction for all backend handlers.
+
+Every endpoint used to rebuild the same SMA/RSI/MACD objects and
+Strategy graph per request; repeat requests (UI parameter sweeps,
+backtest-then-analyze flows) now reuse the cached object instead.
+"""
+
+from functools import lru_cache
+from fastapi import HTTPException
+from engine.strategy import Strategy, SMA, RSI, MACD
+
+# Table dispatch instead of a per-indicator if/elif ladder: one dict
+# lookup replaces N string compares, and new indicators register here.
+INDICATOR_REGISTRY = {"SMA": SMA, "RSI": RSI, "MACD": MACD}
+
+
+@lru_cache(maxsize=4096)
+def _make_indicator(name: str, params_key: tuple):
+    """Shared, frozen Indicator instance per (name, params). Indicators are
+    stateless after construction — calculate() only reads self.params — so
+    the same object can appear in many cached Strategies. Cached separately
+    from the Strategy so a parameter sweep that varies one indicator still
+    reuses the others."""
+    try:
+        cls = INDICATOR_REGISTRY[name]
+    except KeyError:
+        raise HTTPException(status_code=400, detail=f"Unknown indicator {name}")
+    return cls(name, dict(params_key))
+
+
+@lru_cache(maxsize=512)
+def _build_strategy_cached(indicators_key, rules_key):
+    indicators = [_make_indicator(name, params_key)
+                  for name, params_key in indicators_key]
+    rules_dict = [dict(rule_key) for rule_key in rules_key]
+    return Strategy(indicators, rules_dict)
+
+
+def build_strategy(indicator_configs, rules) -> Strategy:
+    """Build (or fetch the cached) Strategy for a request's indicator and
+    rule configs. Params and rules are frozen into sorted tuples so the
+    whole request shape is hashable."""
+    indicators_key = tuple(
+        (c.name, tuple(sorted(c.params.items()))) for c in indicator_configs
+    )
+    rules_key = tuple(tuple(sorted(r.model_dump().items())) for r in rules)
+    return _build_strategy_cached(indicators_key, rules_key)
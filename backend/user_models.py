@@ -1,7 +1,16 @@
-from pydantic import BaseModel
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, StringConstraints
+
+from security.validator import USERNAME_PATTERN
+
+# Same allowlist as security.validator, enforced by pydantic-core at
+# parse time — malformed payloads get a 422 before the handler runs,
+# and the regex executes in Rust rather than Python.
+Username = Annotated[str, StringConstraints(pattern=USERNAME_PATTERN)]
 
 class UserCreate(BaseModel):
-    username: str
+    username: Username
     password: str
 
 class UserResponse(BaseModel):
@@ -9,5 +18,4 @@ class UserResponse(BaseModel):
     username: str
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,68 @@
+"""
+Numba-compiled simulation kernels for the Backtester.
+
+The buy/sell state machine is inherently sequential (each bar depends on
+the position left by the previous one), so instead of forcing it into
+array form we compile the scalar loop with numba. Falls back to plain
+Python when numba isn't installed; callers should check NUMBA_AVAILABLE
+and prefer their vectorized path in that case.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def simulate(close, signal, cap0):
+    """Run the long/flat state machine over one price series.
+
+    Returns (equity, trade_idx, trade_side, trade_price, capital, position)
+    where trade_side is +1 for buys and -1 for sells and the trade arrays
+    are trimmed to the number of executed trades.
+    """
+    n = close.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    trade_idx = np.empty(n, dtype=np.int64)
+    trade_side = np.empty(n, dtype=np.int8)
+    trade_price = np.empty(n, dtype=np.float64)
+    k = 0
+    capital = cap0
+    position = 0.0
+
+    for i in range(n):
+        price = close[i]
+        s = signal[i]
+        if s == 1 and position == 0.0:  # Buy
+            position = capital / price
+            capital = 0.0
+            trade_idx[k] = i
+            trade_side[k] = 1
+            trade_price[k] = price
+            k += 1
+        elif s == -1 and position > 0.0:  # Sell
+            capital = position * price
+            position = 0.0
+            trade_idx[k] = i
+            trade_side[k] = -1
+            trade_price[k] = price
+            k += 1
+        equity[i] = capital + position * price
+
+    return equity, trade_idx[:k], trade_side[:k], trade_price[:k], capital, position
+
+
+if NUMBA_AVAILABLE:
+    # Warm-up compile at import (cache=True persists it across processes)
+    simulate(np.ones(2, dtype=np.float64), np.zeros(2, dtype=np.int8), 1.0)
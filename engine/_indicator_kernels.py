@@ -0,0 +1,124 @@
+"""
+Numba-compiled indicator kernels for engine.strategy.
+
+Outputs follow the input dtype; the running accumulators stay float64
+scalars either way, so float32 series get float32 outputs (half the
+bytes through cache) without float32 summation drift.
+
+The pandas rolling/where pipelines allocate several full-length
+temporaries per indicator; these kernels keep running accumulators and
+produce each output in a single traversal of the close array. As in
+_backtest_kernels, numba is optional — without it the kernels run as
+plain Python over numpy scalars with identical results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def _sma(close, window):
+    """Rolling mean with a running sum; NaN through the warm-up window,
+    matching pandas rolling(window).mean()."""
+    n = close.shape[0]
+    out = np.full(n, np.nan, dtype=close.dtype)
+    acc = 0.0
+    for i in range(n):
+        acc += close[i]
+        if i >= window:
+            acc -= close[i - window]
+        if i >= window - 1:
+            out[i] = acc / window
+    return out
+
+
+@njit(cache=True)
+def _rsi(close, window):
+    """Wilder RSI as a single forward recursion.
+
+    Average gain/loss follow the ewm(alpha=1/window, adjust=False)
+    recurrence, seeded with the first delta — the canonical smoothing
+    rather than the simple rolling means the first version used, and one
+    pass with two scalar accumulators instead of two O(N*W) windows.
+    Index 0 has no delta and stays NaN; all-loss stretches give RSI 100
+    (rs = inf) and perfectly flat ones NaN (0/0), as before.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan, dtype=close.dtype)
+    if n < 2:
+        return out
+    alpha = 1.0 / window
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain += alpha * (gain - avg_gain)
+            avg_loss += alpha * (loss - avg_loss)
+        if avg_loss <= 0.0:
+            out[i] = np.nan if avg_gain <= 0.0 else 100.0
+        else:
+            rs = avg_gain / avg_loss
+            out[i] = 100.0 - 100.0 / (1.0 + rs)
+    return out
+
+
+@njit(cache=True)
+def _macd(close, fast, slow, signal):
+    """MACD line, signal line and histogram fused into one pass.
+
+    Uses the adjust=False EMA recurrence directly (seeded with the first
+    close, like pandas ewm), so the three ewm().mean() walks and their
+    Series temporaries collapse to one read of close and three writes.
+    """
+    n = close.shape[0]
+    macd = np.empty(n, dtype=close.dtype)
+    signal_line = np.empty(n, dtype=close.dtype)
+    histogram = np.empty(n, dtype=close.dtype)
+    if n == 0:
+        return macd, signal_line, histogram
+
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_sig = 2.0 / (signal + 1.0)
+    ema_fast = close[0]
+    ema_slow = close[0]
+    sig = 0.0
+    for i in range(n):
+        if i > 0:
+            ema_fast += alpha_fast * (close[i] - ema_fast)
+            ema_slow += alpha_slow * (close[i] - ema_slow)
+        m = ema_fast - ema_slow
+        if i == 0:
+            sig = m
+        else:
+            sig += alpha_sig * (m - sig)
+        macd[i] = m
+        signal_line[i] = sig
+        histogram[i] = m - sig
+    return macd, signal_line, histogram
+
+
+if NUMBA_AVAILABLE:
+    # Warm-up compile at import (cache=True persists it across processes)
+    _warm = np.ones(2, dtype=np.float64)
+    _sma(_warm, 2)
+    _rsi(_warm, 2)
+    _macd(_warm, 2, 3, 2)
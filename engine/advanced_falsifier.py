@@ -8,6 +8,7 @@ Advanced ML-based Falsifier with comprehensive capabilities:
 6. Hybrid rule-based + ML approach
 """
 
+import os
 import torch
 import torch.nn as nn
 import torch.optim as optim
@@ -36,7 +37,6 @@ class LSTMPredictor(nn.Module):
         self.relu = nn.ReLU()
         self.dropout = nn.Dropout(0.3)
         self.fc2 = nn.Linear(32, output_size)
-        self.sigmoid = nn.Sigmoid()
     
     def forward(self, x):
         # x shape: (batch, seq_len, input_size)
@@ -46,8 +46,9 @@ class LSTMPredictor(nn.Module):
         out = self.fc1(out)
         out = self.relu(out)
         out = self.dropout(out)
-        out = self.fc2(out)
-        return self.sigmoid(out)
+        # Raw logits: training pairs this with BCEWithLogitsLoss (fused
+        # log-sigmoid, one kernel) and inference applies sigmoid itself
+        return self.fc2(out)
 
 
 # ============================================================================
@@ -71,8 +72,10 @@ class ComplexPatternNet(nn.Module):
             ])
             prev_size = hidden_size
         
+        # Raw logits, same contract as LSTMPredictor: training uses
+        # BCEWithLogitsLoss (and stays autocast-safe), inference applies
+        # sigmoid itself
         layers.append(nn.Linear(prev_size, output_size))
-        layers.append(nn.Sigmoid())
         
         self.network = nn.Sequential(*layers)
     
@@ -148,9 +151,38 @@ class NewsSentimentAnalyzer:
         # -1 (very negative) to +1 (very positive)
         sentiment = (positive_count - negative_count) / total
         confidence = min(total / 10.0, 1.0)  # More keywords = higher confidence
-        
+
         return {'sentiment': sentiment, 'confidence': confidence}
 
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Analyze a batch of texts in one pass.
+
+        Hoists the keyword lists into locals and scans all texts in a single
+        call, so per-article dispatch overhead is amortized across the batch.
+        (A transformer-backed analyzer would batch-tokenize + run one forward
+        pass here instead.)
+        """
+        negative_keywords = self.negative_keywords
+        positive_keywords = self.positive_keywords
+        results = []
+
+        for text in texts:
+            text_lower = text.lower()
+            negative_count = sum(1 for word in negative_keywords if word in text_lower)
+            positive_count = sum(1 for word in positive_keywords if word in text_lower)
+
+            total = negative_count + positive_count
+            if total == 0:
+                results.append({'sentiment': 0.0, 'confidence': 0.0})
+            else:
+                results.append({
+                    'sentiment': (positive_count - negative_count) / total,
+                    'confidence': min(total / 10.0, 1.0)
+                })
+
+        return results
+
 
 # ============================================================================
 # 5. ADAPTIVE LEARNER (Online Learning)
@@ -158,24 +190,36 @@ class NewsSentimentAnalyzer:
 
 class AdaptiveLearner:
     """Continuously learns from new data."""
-    def __init__(self, model: nn.Module, lr=0.001):
+    def __init__(self, model: nn.Module, lr=0.001, criterion: nn.Module = None):
         self.model = model
         self.optimizer = optim.Adam(model.parameters(), lr=lr)
-        self.criterion = nn.BCELoss()
+        # Both nets emit logits now; BCELoss remains the fallback for any
+        # probability-output model wired in externally
+        self.criterion = criterion if criterion is not None else nn.BCELoss()
         self.update_count = 0
     
     def update(self, X: torch.Tensor, y: torch.Tensor):
         """Update model with new data point."""
+        # Models stay pinned to eval() between updates; flip to train mode
+        # only for this step and always restore.
         self.model.train()
-        self.optimizer.zero_grad()
-        
-        output = self.model(X)
-        loss = self.criterion(output, y)
-        loss.backward()
-        self.optimizer.step()
-        
+        try:
+            # set_to_none skips the zero-fill pass; backward then writes
+            # fresh grads instead of accumulating into zeroed tensors
+            self.optimizer.zero_grad(set_to_none=True)
+
+            output = self.model(X)
+            loss = self.criterion(output, y)
+            loss.backward()
+            self.optimizer.step()
+        finally:
+            self.model.eval()
+
         self.update_count += 1
-        return loss.item()
+        # Detached tensor, not .item(): the scalar conversion forces a
+        # sync with the compute stream; callers materialize a float only
+        # where one is actually logged.
+        return loss.detach()
     
     def should_retrain(self, threshold=100):
         """Check if full retraining is needed."""
@@ -207,17 +251,43 @@ class AdvancedFalsifier:
         self.anomaly_detector = AnomalyDetector()
         self.sentiment_analyzer = NewsSentimentAnalyzer()
         
+        # Models serve inference almost always — pin them to eval() once
+        # here instead of toggling per predict call (each toggle walks
+        # every submodule); AdaptiveLearner.update restores eval after
+        # its brief train()-mode step.
+        self.lstm_predictor.eval()
+        self.pattern_detector.eval()
+
         # Adaptive learners
-        self.lstm_learner = AdaptiveLearner(self.lstm_predictor)
-        self.pattern_learner = AdaptiveLearner(self.pattern_detector)
+        self.lstm_learner = AdaptiveLearner(self.lstm_predictor,
+                                            criterion=nn.BCEWithLogitsLoss())
+        self.pattern_learner = AdaptiveLearner(self.pattern_detector,
+                                               criterion=nn.BCEWithLogitsLoss())
         
         # Load pre-trained weights if available
         self._load_models()
-        
+
         # Rule-based thresholds
         self.failure_threshold = 0.6
         self.anomaly_threshold = 0.7
+
+        # Weights stay FP32 (training needs them); inference can opt into
+        # BF16 autocast on CPUs with AVX512-BF16 — halves the bytes moved
+        # through cache for the matmuls on this memory-bound path
+        self._bf16_inference = os.getenv("STRESSLAB_BF16_INFERENCE") == "1"
+
+        # Status snapshot computed once at (re)load time so the liveness
+        # endpoint doesn't walk model attributes on every poll
+        self._status = {
+            'lstm_loaded': hasattr(self.lstm_predictor, 'lstm'),
+            'pattern_detector_loaded': hasattr(self.pattern_detector, 'network'),
+            'model_dir': str(self.model_dir),
+        }
     
+    def _autocast(self):
+        """Inference autocast context — BF16 when enabled, no-op otherwise."""
+        return torch.autocast('cpu', dtype=torch.bfloat16, enabled=self._bf16_inference)
+
     def _load_models(self):
         """Load pre-trained model weights."""
         lstm_path = self.model_dir / "lstm_predictor.pth"
@@ -234,15 +304,96 @@ class AdvancedFalsifier:
                 torch.load(pattern_path, map_location='cpu', weights_only=True)
             )
             print("✓ Loaded pattern detector")
+
+        # Keep eager handles for training/saving, then script the
+        # inference-facing attributes
+        self._eager_lstm = self.lstm_predictor
+        self._eager_pattern = self.pattern_detector
+        self._compile_inference()
+
+    def _compile_inference(self):
+        """Build the quantized + TorchScript inference modules.
+
+        Dynamic int8 quantization of the LSTM/Linear weights first: these
+        nets run at batch size ~1 where streaming FP32 weights dominates,
+        and int8 quarters those bytes with negligible accuracy loss.
+        Then scripting removes eager-mode Python dispatch, which dominates
+        for models this small. We deliberately stop short of
+        optimize_for_inference/freezing: the adaptive-learning path keeps
+        updating the eager FP32 copies (quantized modules aren't
+        trainable), so we re-quantize and re-script from them after online
+        updates instead. Each step falls back to the previous module if it
+        raises.
+        """
+        lstm = self._eager_lstm.eval()
+        pattern = self._eager_pattern.eval()
+        try:
+            lstm = torch.ao.quantization.quantize_dynamic(
+                lstm, {nn.LSTM, nn.Linear}, dtype=torch.qint8
+            )
+            pattern = torch.ao.quantization.quantize_dynamic(
+                pattern, {nn.Linear}, dtype=torch.qint8
+            )
+        except Exception as e:
+            print(f"int8 quantization unavailable, keeping FP32 inference: {e}")
+        try:
+            self.lstm_predictor = torch.jit.script(lstm)
+            self.pattern_detector = torch.jit.script(pattern)
+        except Exception as e:
+            print(f"TorchScript compile failed, staying eager: {e}")
+            self.lstm_predictor = lstm
+            self.pattern_detector = pattern
     
     def save_models(self):
-        """Save trained models."""
-        torch.save(self.lstm_predictor.state_dict(), 
+        """Save trained models (always the eager copies — the scripted
+        inference modules share their weights)."""
+        torch.save(self._eager_lstm.state_dict(), 
                   self.model_dir / "lstm_predictor.pth")
-        torch.save(self.pattern_detector.state_dict(),
+        torch.save(self._eager_pattern.state_dict(),
                   self.model_dir / "pattern_detector.pth")
         print("✓ Models saved")
     
+    @staticmethod
+    def _build_lstm_seq(arr: np.ndarray) -> np.ndarray:
+        """Assemble the (10, 5) LSTM input directly from the returns array.
+
+        Each timestep only ever used the first five window values (the
+        std/mean features sat past the [:5] slice of prepare_features),
+        so ten slice assignments into a preallocated buffer replace the
+        old per-prefix feature calls.
+        """
+        n = arr.shape[0]
+        seq = np.zeros((10, 5), dtype=np.float32)
+        for k, t in enumerate(range(n - 10, n)):
+            start = max(0, t - 9)
+            seg = arr[start:start + 5]
+            seq[k, :seg.shape[0]] = seg
+        return seq
+
+    def _featurize(self, returns: List[float],
+                   macro_indicators: Dict[str, float] = None):
+        """Build every sub-model input from one pass over the returns.
+
+        Returns (lstm_seq, pattern_X, anomaly_feat): the LSTM sequence
+        tensor (None with <10 returns), the pattern-net input tensor, and
+        the macro-free feature vector the anomaly detector expects.
+        """
+        feat = self.prepare_features(returns, macro_indicators)
+        if macro_indicators:
+            # Anomaly detector was fitted on macro-free features
+            anomaly_feat = feat.copy()
+            anomaly_feat[13:16] = 0
+        else:
+            anomaly_feat = feat
+
+        if len(returns) < 10:
+            lstm_seq = None
+        else:
+            lstm_seq = torch.from_numpy(
+                self._build_lstm_seq(np.asarray(returns, dtype=np.float32))
+            ).unsqueeze(0)
+        return lstm_seq, torch.from_numpy(feat).unsqueeze(0), anomaly_feat
+
     def prepare_features(self, returns: List[float], 
                         macro_indicators: Dict[str, float] = None) -> np.ndarray:
         """
@@ -254,33 +405,35 @@ class AdvancedFalsifier:
         - Trend
         - Macro indicators (VIX, interest rates, etc.)
         """
-        features = []
-        
-        # Returns-based features
-        recent_returns = returns[-10:] if len(returns) >= 10 else returns
-        features.extend(recent_returns + [0] * (10 - len(recent_returns)))
-        
-        # Statistical features
-        if len(returns) > 1:
-            features.append(np.std(returns))  # Volatility
-            features.append(np.mean(returns))  # Average return
-            features.append(returns[-1] if returns else 0)  # Latest return
-        else:
-            features.extend([0, 0, 0])
+        # Written straight into a 20-float buffer with slice assignments —
+        # no Python list growth, no per-element appends, one allocation.
+        # (A shared instance scratch buffer was considered but the pool
+        # replicas serve concurrent threads, so each call gets its own.)
+        out = np.zeros(20, dtype=np.float32)
+        arr = np.asarray(returns, dtype=np.float32)
+        n = arr.shape[0]
+        
+        # Returns-based features (last 10, zero-padded at the tail)
+        m = min(10, n)
+        out[:m] = arr[-m:]
+        
+        # Statistical features, from first/second moments in one pass:
+        # arr.std() alone re-walks the array twice (mean, then squared
+        # deviations); sum + dot gives both stats from a single sweep.
+        if n > 1:
+            mean = float(arr.sum()) / n
+            var = float(np.dot(arr, arr)) / n - mean * mean
+            out[10] = np.sqrt(max(var, 0.0))  # Volatility
+            out[11] = mean                    # Average return
+            out[12] = arr[-1]                 # Latest return
         
         # Macro indicators (if provided)
         if macro_indicators:
-            features.append(macro_indicators.get('vix', 0))
-            features.append(macro_indicators.get('interest_rate', 0))
-            features.append(macro_indicators.get('unemployment', 0))
-        else:
-            features.extend([0, 0, 0])
-        
-        # Pad to 20 features
-        while len(features) < 20:
-            features.append(0)
+            out[13] = macro_indicators.get('vix', 0)
+            out[14] = macro_indicators.get('interest_rate', 0)
+            out[15] = macro_indicators.get('unemployment', 0)
         
-        return np.array(features[:20], dtype=np.float32)
+        return out
     
     def predict_future_failure(self, returns: List[float], 
                               macro_indicators: Dict[str, float] = None) -> float:
@@ -290,18 +443,13 @@ class AdvancedFalsifier:
         if len(returns) < 10:
             return 0.5
         
-        # Prepare sequence
-        features = []
-        for i in range(len(returns) - 10, len(returns)):
-            feat = self.prepare_features(returns[:i+1], macro_indicators)
-            features.append(feat[:5])  # Use first 5 features for LSTM
-        
-        X = torch.tensor([features], dtype=torch.float32)
-        
-        self.lstm_predictor.eval()
-        with torch.no_grad():
-            prob = self.lstm_predictor(X)
+        X = torch.from_numpy(
+            self._build_lstm_seq(np.asarray(returns, dtype=np.float32))
+        ).unsqueeze(0)
         
+        with torch.inference_mode(), self._autocast():
+            prob = torch.sigmoid(self.lstm_predictor(X))
+
         return prob.item()
     
     def detect_complex_patterns(self, returns: List[float],
@@ -312,10 +460,9 @@ class AdvancedFalsifier:
         features = self.prepare_features(returns, macro_indicators)
         X = torch.tensor([features], dtype=torch.float32)
         
-        self.pattern_detector.eval()
-        with torch.no_grad():
-            prob = self.pattern_detector(X)
-        
+        with torch.inference_mode(), self._autocast():
+            prob = torch.sigmoid(self.pattern_detector(X))
+
         return prob.item()
     
     def check_anomaly(self, returns: List[float]) -> Tuple[bool, float, str]:
@@ -340,14 +487,19 @@ class AdvancedFalsifier:
         """
         Analyze news sentiment and predict market impact.
         """
-        sentiments = [self.sentiment_analyzer.analyze_sentiment(text) 
-                     for text in news_texts]
+        sentiments = self.sentiment_analyzer.analyze_sentiment_batch(news_texts)
         
         if not sentiments:
             return {'avg_sentiment': 0.0, 'confidence': 0.0, 'impact': 'neutral'}
         
-        avg_sentiment = np.mean([s['sentiment'] for s in sentiments])
-        avg_confidence = np.mean([s['confidence'] for s in sentiments])
+        # np.fromiter builds the aggregate arrays without intermediate lists
+        n = len(sentiments)
+        avg_sentiment = np.fromiter(
+            (s['sentiment'] for s in sentiments), dtype=np.float64, count=n
+        ).mean()
+        avg_confidence = np.fromiter(
+            (s['confidence'] for s in sentiments), dtype=np.float64, count=n
+        ).mean()
         
         if avg_sentiment < -0.3:
             impact = 'negative'
@@ -363,57 +515,141 @@ class AdvancedFalsifier:
             'num_articles': len(news_texts)
         }
     
-    def comprehensive_analysis(self, 
-                              returns: List[float],
-                              macro_indicators: Dict[str, float] = None,
-                              news_texts: List[str] = None) -> Dict[str, Any]:
+    def combine_analysis(self,
+                        future_failure_prob: float,
+                        complex_pattern_prob: float,
+                        anomaly: Tuple[bool, float, str],
+                        news_sentiment: Dict[str, Any] = None) -> Dict[str, Any]:
         """
-        Perform comprehensive analysis using all methods.
+        Merge independently computed sub-model outputs into the
+        comprehensive result payload (combined risk + recommendation).
         """
-        results = {}
-        
-        # 1. Future prediction (LSTM)
-        results['future_failure_prob'] = self.predict_future_failure(returns, macro_indicators)
-        
-        # 2. Complex patterns
-        results['complex_pattern_prob'] = self.detect_complex_patterns(returns, macro_indicators)
-        
-        # 3. Anomaly detection
-        is_anomaly, anomaly_score, anomaly_desc = self.check_anomaly(returns)
-        results['anomaly'] = {
-            'detected': is_anomaly,
-            'score': anomaly_score,
-            'description': anomaly_desc
+        is_anomaly, anomaly_score, anomaly_desc = anomaly
+        results = {
+            'future_failure_prob': future_failure_prob,
+            'complex_pattern_prob': complex_pattern_prob,
+            'anomaly': {
+                'detected': is_anomaly,
+                'score': anomaly_score,
+                'description': anomaly_desc
+            }
         }
-        
-        # 4. News sentiment (if provided)
-        if news_texts:
-            results['news_sentiment'] = self.analyze_news_impact(news_texts)
-        
-        # 5. Combined risk score (weighted average)
+
+        if news_sentiment is not None:
+            results['news_sentiment'] = news_sentiment
+
+        # Combined risk score (weighted average)
         weights = {
             'future': 0.4,
             'pattern': 0.3,
             'anomaly': 0.2,
             'sentiment': 0.1
         }
-        
+
         risk_score = (
-            weights['future'] * results['future_failure_prob'] +
-            weights['pattern'] * results['complex_pattern_prob'] +
+            weights['future'] * future_failure_prob +
+            weights['pattern'] * complex_pattern_prob +
             weights['anomaly'] * (anomaly_score if is_anomaly else 0)
         )
-        
-        if news_texts and results.get('news_sentiment'):
-            sentiment_risk = max(0, -results['news_sentiment']['avg_sentiment'])
+
+        if news_sentiment is not None:
+            sentiment_risk = max(0, -news_sentiment['avg_sentiment'])
             risk_score += weights['sentiment'] * sentiment_risk
-        
+
         results['combined_risk_score'] = risk_score
-        
-        # 6. Generate recommendation
         results['recommendation'] = self._generate_recommendation(results)
-        
+
         return results
+
+    def comprehensive_analysis(self,
+                              returns: List[float],
+                              macro_indicators: Dict[str, float] = None,
+                              news_texts: List[str] = None) -> Dict[str, Any]:
+        """
+        Perform comprehensive analysis using all methods.
+        """
+        # Featurize once, then run both nets inside a single
+        # autograd-disabled scope — one tensor build and one context entry
+        # instead of three.
+        lstm_seq, pattern_X, anomaly_feat = self._featurize(returns, macro_indicators)
+
+        with torch.inference_mode(), self._autocast():
+            future_prob = (torch.sigmoid(self.lstm_predictor(lstm_seq)).item()
+                           if lstm_seq is not None else 0.5)
+            pattern_prob = torch.sigmoid(self.pattern_detector(pattern_X)).item()
+
+        if len(returns) < 10:
+            anomaly = (False, 0.0, "Insufficient data")
+        else:
+            is_anomaly, score = self.anomaly_detector.detect_anomaly(anomaly_feat)
+            if is_anomaly:
+                desc = f"Unusual pattern detected (anomaly score: {score:.2f})"
+            else:
+                desc = "Pattern within normal range"
+            anomaly = (is_anomaly, score, desc)
+
+        return self.combine_analysis(
+            future_prob,
+            pattern_prob,
+            anomaly,
+            self.analyze_news_impact(news_texts) if news_texts else None
+        )
+
+    def comprehensive_analysis_batch(self,
+                                    returns_batch: List[List[float]],
+                                    macro_batch: List[Dict[str, float]] = None,
+                                    news_batch: List[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Batched variant of comprehensive_analysis.
+
+        Runs ONE forward pass per model for the whole batch instead of one
+        per request, so concurrent requests amortize the model weight loads.
+        Falls back to the single-item path for items with too little history.
+        """
+        n = len(returns_batch)
+        macro_batch = macro_batch if macro_batch is not None else [None] * n
+        news_batch = news_batch if news_batch is not None else [None] * n
+
+        # Build feature tensors for the whole batch
+        lstm_inputs = []   # (batch, 10, 5) sequences, None where not enough data
+        pattern_inputs = []  # (batch, 20) feature vectors
+
+        for returns, macro in zip(returns_batch, macro_batch):
+            pattern_inputs.append(self.prepare_features(returns, macro))
+
+            if len(returns) < 10:
+                lstm_inputs.append(None)
+            else:
+                lstm_inputs.append(
+                    self._build_lstm_seq(np.asarray(returns, dtype=np.float32))
+                )
+
+        # One batched forward per model
+        X_pattern = torch.tensor(np.stack(pattern_inputs), dtype=torch.float32)
+
+        lstm_idx = [i for i, seq in enumerate(lstm_inputs) if seq is not None]
+        lstm_probs = {}
+
+        with torch.inference_mode(), self._autocast():
+            pattern_probs = torch.sigmoid(self.pattern_detector(X_pattern)).squeeze(-1)
+            if lstm_idx:
+                X_lstm = torch.tensor(
+                    np.stack([lstm_inputs[i] for i in lstm_idx]), dtype=torch.float32
+                )
+                probs = torch.sigmoid(self.lstm_predictor(X_lstm)).squeeze(-1)
+                lstm_probs = {i: probs[j].item() for j, i in enumerate(lstm_idx)}
+
+        # Scatter results back per request
+        all_results = []
+        for i, (returns, news_texts) in enumerate(zip(returns_batch, news_batch)):
+            all_results.append(self.combine_analysis(
+                lstm_probs.get(i, 0.5),
+                pattern_probs[i].item(),
+                self.check_anomaly(returns),
+                self.analyze_news_impact(news_texts) if news_texts else None
+            ))
+
+        return all_results
     
     def _generate_recommendation(self, analysis: Dict[str, Any]) -> str:
         """Generate actionable recommendation."""
@@ -443,8 +679,11 @@ class AdvancedFalsifier:
         X_pattern = torch.tensor([features], dtype=torch.float32)
         y = torch.tensor([[1.0 if actual_failure else 0.0]], dtype=torch.float32)
         
-        # Update pattern detector
-        loss = self.pattern_learner.update(X_pattern, y)
+        # Update pattern detector (trains the eager copy), then refresh
+        # the scripted inference module so predictions see the new weights.
+        # The returned loss tensor is dropped unconverted — nothing logs it.
+        self.pattern_learner.update(X_pattern, y)
+        self._compile_inference()
         
         # Check if full retraining needed
         if self.pattern_learner.should_retrain():
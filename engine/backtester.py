@@ -2,6 +2,7 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 from .strategy import Strategy
+from ._backtest_kernels import NUMBA_AVAILABLE, simulate
 
 class Backtester:
     def __init__(self, data: pd.DataFrame, initial_capital: float = 10000.0):
@@ -14,32 +15,71 @@ class Backtester:
         Run a strategy on the data.
         """
         df = strategy.generate_signals(self.data)
-        
-        # Simulation
-        capital = self.initial_capital
-        position = 0
-        trades = []
-        equity_curve = []
 
-        for i, row in df.iterrows():
-            price = row['Close']
-            signal = row.get('Signal', 0)
+        # Vectorized simulation: capital/position only change on signal
+        # days, so the Python loop runs over the (sparse) nonzero signals
+        # and the per-bar equity math is one array expression instead of
+        # an iterrows() pass over every row.
+        close = df['Close'].to_numpy(np.float64)
+        n = close.shape[0]
+        if 'Signal' in df.columns:
+            sig = df['Signal'].to_numpy()
+        else:
+            sig = np.zeros(n, dtype=np.int8)
 
-            if signal == 1 and position == 0: # Buy
-                position = capital / price
-                capital = 0
-                trades.append({'date': i, 'type': 'buy', 'price': price})
-            elif signal == -1 and position > 0: # Sell
-                capital = position * price
-                position = 0
-                trades.append({'date': i, 'type': 'sell', 'price': price})
-            
-            current_value = capital + (position * price)
-            equity_curve.append(current_value)
+        if NUMBA_AVAILABLE:
+            # Compiled scalar state machine: handles path-dependent logic
+            # (future stop-losses/position sizing) at native speed.
+            equity_curve, t_idx, t_side, t_price, capital, position = simulate(
+                close, sig.astype(np.int8), float(self.initial_capital)
+            )
+            trade_dates = [df.index[i] for i in t_idx]
+            trade_types = ['buy' if side == 1 else 'sell' for side in t_side]
+            trade_prices = list(t_price)
+        else:
+            capital = self.initial_capital
+            position = 0.0
+            capital_arr = np.empty(n, dtype=np.float64)
+            position_arr = np.empty(n, dtype=np.float64)
+            # Trades stay as three parallel columns (SoA) so callers can
+            # format/serialize them with one vectorized call per column.
+            trade_dates = []
+            trade_types = []
+            trade_prices = []
 
+            last = 0
+            for i in np.flatnonzero(sig != 0):
+                capital_arr[last:i] = capital
+                position_arr[last:i] = position
+                price = close[i]
+                if sig[i] == 1 and position == 0:  # Buy
+                    position = capital / price
+                    capital = 0.0
+                    trade_dates.append(df.index[i])
+                    trade_types.append('buy')
+                    trade_prices.append(price)
+                elif sig[i] == -1 and position > 0:  # Sell
+                    capital = position * price
+                    position = 0.0
+                    trade_dates.append(df.index[i])
+                    trade_types.append('sell')
+                    trade_prices.append(price)
+                last = i
+            capital_arr[last:] = capital
+            position_arr[last:] = position
+
+            equity_curve = capital_arr + position_arr * close
+
+        trades = [
+            {'date': d, 'type': t, 'price': p}
+            for d, t, p in zip(trade_dates, trade_types, trade_prices)
+        ]
         self.results = {
-            'final_capital': capital + (position * df.iloc[-1]['Close']),
+            'final_capital': capital + (position * close[-1]) if n else capital,
             'trades': trades,
-            'equity_curve': equity_curve
+            'trade_dates': np.asarray(trade_dates),
+            'trade_types': np.asarray(trade_types),
+            'trade_prices': np.asarray(trade_prices, dtype=np.float64),
+            'equity_curve': equity_curve.tolist()
         }
         return self.results
@@ -11,14 +11,13 @@ class FalsifierModel(nn.Module):
         self.hidden_size = hidden_size
         self.lstm = nn.LSTM(input_size, hidden_size, batch_first=True)
         self.fc = nn.Linear(hidden_size, output_size)
-        self.sigmoid = nn.Sigmoid()
 
     def forward(self, x):
         # x shape: (batch, seq_len, input_size)
         out, _ = self.lstm(x)
-        # Take the last time step
-        out = self.fc(out[:, -1, :])
-        return self.sigmoid(out)
+        # Take the last time step; returns raw logits — training uses the
+        # fused BCEWithLogitsLoss and inference applies sigmoid once
+        return self.fc(out[:, -1, :])
 
 class Falsifier:
     def __init__(self, model_path: str = "./data/models/falsifier_weights.pth", use_pretrained: bool = True):
@@ -52,17 +51,51 @@ class Falsifier:
             # Initialize with random weights
             self.model = FalsifierModel()
         
-        self.criterion = nn.BCELoss()
+        self.criterion = nn.BCEWithLogitsLoss()
         self.optimizer = optim.Adam(self.model.parameters(), lr=0.01)
 
+        self.model.eval()
+        self._refresh_inference()
+
+    def _refresh_inference(self):
+        """(Re)build the inference module from the FP32 training model.
+
+        Two steps, each with an eager fallback:
+        1. Dynamic int8 quantization of the LSTM/Linear weights — at
+           batch size 1 inference is bound on streaming weight bytes, so
+           int8 weights roughly quarter the traffic. Quantization
+           snapshots the weights, so train() calls this again afterwards;
+           self.model itself stays FP32 and trainable.
+        2. Shape-specialized torch.compile of the fixed (1, 10, 1) path,
+           with a dummy warm-up forward so the lazy compile cost lands
+           here instead of on the first real request.
+        """
+        infer = self.model
+        try:
+            infer = torch.ao.quantization.quantize_dynamic(
+                self.model, {nn.LSTM, nn.Linear}, dtype=torch.qint8
+            )
+        except Exception as e:
+            print(f"int8 quantization unavailable, keeping FP32 inference: {e}")
+        try:
+            compiled = torch.compile(
+                infer, mode="reduce-overhead", dynamic=False, fullgraph=True
+            )
+            with torch.no_grad():
+                compiled(torch.zeros(1, 10, 1))
+            self._compiled = compiled
+        except Exception as e:
+            print(f"torch.compile unavailable, using eager model: {e}")
+            self._compiled = infer
+
     def prepare_data(self, returns: List[float], seq_len: int = 10) -> Tuple[torch.Tensor, torch.Tensor]:
-        X, y = [], []
-        for i in range(len(returns) - seq_len):
-            X.append(returns[i:i+seq_len])
-            # Target: 1 if next return is negative (failure), 0 otherwise
-            y.append(1 if returns[i+seq_len] < 0 else 0)
-        
-        return torch.tensor(X, dtype=torch.float32).unsqueeze(-1), torch.tensor(y, dtype=torch.float32).unsqueeze(-1)
+        # Windowing via stride tricks: one strided view + one copy instead
+        # of a Python slice-and-append per sample.
+        arr = np.asarray(returns, dtype=np.float32)
+        X = np.lib.stride_tricks.sliding_window_view(arr[:-1], seq_len)
+        # Target: 1 if the return following each window is negative
+        y = (arr[seq_len:] < 0).astype(np.float32)[:, None]
+        return torch.from_numpy(np.ascontiguousarray(X)).unsqueeze(-1), torch.from_numpy(y)
 
     def train(self, returns: List[float], epochs: int = 100):
         """
@@ -74,25 +107,39 @@ class Falsifier:
             
         X, y = self.prepare_data(returns)
         
+        # Micro-batched training with gradient accumulation: activation
+        # memory scales with the 64-sample micro-batch instead of the full
+        # history, while one optimizer step per epoch keeps the effective
+        # full-batch update. set_to_none skips the grad zero-fill pass.
+        micro_batch = 64
+        n = X.shape[0]
         self.model.train()
         for epoch in range(epochs):
-            self.optimizer.zero_grad()
-            outputs = self.model(X)
-            loss = self.criterion(outputs, y)
-            loss.backward()
+            perm = torch.randperm(n)
+            n_micro = (n + micro_batch - 1) // micro_batch
+            self.optimizer.zero_grad(set_to_none=True)
+            for start in range(0, n, micro_batch):
+                idx = perm[start:start + micro_batch]
+                outputs = self.model(X[idx])
+                loss = self.criterion(outputs, y[idx]) / n_micro
+                loss.backward()
             self.optimizer.step()
-            
+        self.model.eval()
+        # Quantized/compiled inference weights are snapshots — rebuild
+        self._refresh_inference()
+
     def predict_failure_probability(self, recent_returns: List[float]) -> float:
         """
         Predict failure probability using the (pre-trained) model.
         """
-        self.model.eval()
         if len(recent_returns) < 10:
             return 0.5 # Default uncertainty
             
         # Take last 10 returns
         seq = torch.tensor(recent_returns[-10:], dtype=torch.float32).unsqueeze(0).unsqueeze(-1)
-        with torch.reference_mode():
-            prob = self.model(seq)
+        # inference_mode (not the reference_mode typo this used to be):
+        # skips the version-counter/view tracking that no_grad still pays
+        with torch.inference_mode():
+            prob = torch.sigmoid(self._compiled(seq))
         return prob.item()
 
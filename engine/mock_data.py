@@ -1,25 +1,39 @@
-import random
+import numpy as np
 from datetime import datetime, timedelta
 
 def generate_mock_data(days=100):
     """Generate mock stock data for testing"""
-    data = []
-    price = 100.0
-    date = datetime.now() - timedelta(days=days)
-    
-    for i in range(days):
-        # Random walk with slight upward bias
-        change = random.uniform(-0.03, 0.035)
-        price = max(price * (1 + change), 10.0)
-        
-        data.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Open': price * random.uniform(0.99, 1.01),
-            'High': price * random.uniform(1.0, 1.03),
-            'Low': price * random.uniform(0.97, 1.0),
-            'Close': price,
-            'Volume': random.randint(1000000, 5000000)
-        })
-        date += timedelta(days=1)
-    
-    return data
\ No newline at end of file
+    rng = np.random.default_rng()
+
+    # Random walk with slight upward bias, all draws in one shot
+    changes = rng.uniform(-0.03, 0.035, days)
+    prices = 100.0 * np.cumprod(1 + changes)
+
+    if prices.min() < 10.0:
+        # The $10 floor makes the walk a clamped recurrence (each day
+        # depends on the clamped previous price), so only in this rare
+        # case do we replay it scalar to keep the exact semantics.
+        price = 100.0
+        for i in range(days):
+            price = max(price * (1 + changes[i]), 10.0)
+            prices[i] = price
+
+    open_p = prices * rng.uniform(0.99, 1.01, days)
+    high_p = prices * rng.uniform(1.0, 1.03, days)
+    low_p = prices * rng.uniform(0.97, 1.0, days)
+    volumes = rng.integers(1_000_000, 5_000_001, days)
+
+    start = np.datetime64(datetime.now() - timedelta(days=days), 'D')
+    dates = np.datetime_as_string(start + np.arange(days), unit='D')
+
+    return [
+        {
+            'Date': dates[i],
+            'Open': open_p[i],
+            'High': high_p[i],
+            'Low': low_p[i],
+            'Close': prices[i],
+            'Volume': int(volumes[i]),
+        }
+        for i in range(days)
+    ]
@@ -11,9 +11,12 @@ Usage:
     python engine/preprocess_data.py --input_dir ./data/training/nasdaq/csv --output_dir ./data/training/processed
 """
 
+import os
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import argparse
 from tqdm import tqdm
 
@@ -32,23 +35,29 @@ def generate_labels(returns: pd.Series) -> pd.Series:
     labels = (next_returns < 0).astype(int)
     return labels
 
-def preprocess_ticker(csv_path: Path, output_dir: Path) -> bool:
+def preprocess_ticker(csv_path: Path, output_dir: Path):
     """
     Preprocess a single ticker CSV file.
     
-    Returns True if successful, False otherwise.
+    Returns (True, processed DataFrame) if successful, (False, None)
+    otherwise — the frame goes back to the parent so the combine path
+    doesn't re-read the file it just wrote.
     """
     try:
-        # Read CSV
-        df = pd.read_csv(csv_path)
+        # Peek at the header first, then parse only the columns we keep:
+        # Date plus one price column. The rest of the OHLCV block never
+        # pays tokenizer or conversion cost.
+        columns = pd.read_csv(csv_path, nrows=0).columns
         
         # Check for required columns
-        if 'Close' not in df.columns and 'Adjusted Close' not in df.columns:
+        if 'Close' not in columns and 'Adjusted Close' not in columns:
             print(f"  Warning: {csv_path.name} missing Close/Adjusted Close column")
-            return False
+            return False, None
         
         # Use Adjusted Close if available, otherwise Close
-        price_col = 'Adjusted Close' if 'Adjusted Close' in df.columns else 'Close'
+        price_col = 'Adjusted Close' if 'Adjusted Close' in columns else 'Close'
+        usecols = ['Date', price_col] if 'Date' in columns else [price_col]
+        df = pd.read_csv(csv_path, usecols=usecols, dtype={price_col: 'float32'})
         
         # Calculate returns
         df['return'] = calculate_returns(df, price_col)
@@ -69,15 +78,16 @@ def preprocess_ticker(csv_path: Path, output_dir: Path) -> bool:
         ticker = csv_path.stem
         output_df['ticker'] = ticker
         
-        # Save processed data
-        output_path = output_dir / f"{ticker}.csv"
-        output_df.to_csv(output_path, index=False)
+        # Save processed data as parquet: columnar + snappy-compressed,
+        # several times smaller and faster to load than CSV
+        output_path = output_dir / f"{ticker}.parquet"
+        output_df.to_parquet(output_path, index=False, compression='snappy')
         
-        return True
+        return True, output_df
         
     except Exception as e:
         print(f"  Error processing {csv_path.name}: {e}")
-        return False
+        return False, None
 
 def main():
     parser = argparse.ArgumentParser(description='Preprocess NASDAQ OHLCV data for training')
@@ -107,21 +117,24 @@ def main():
     print(f"Output directory: {output_path}")
     print()
     
-    # Process each file
-    successful = 0
-    failed = 0
+    # Process files in parallel — each ticker is independent, so the
+    # per-file work fans out across one worker per core
     all_data = []
-    
-    for csv_file in tqdm(csv_files, desc="Processing tickers"):
-        if preprocess_ticker(csv_file, output_path):
-            successful += 1
-            
-            # If combining, read the processed file
-            if args.combine:
-                processed_df = pd.read_csv(output_path / f"{csv_file.stem}.csv")
-                all_data.append(processed_df)
-        else:
-            failed += 1
+    worker = partial(preprocess_ticker, output_dir=output_path)
+    # Batch several files per dispatch: with the default chunksize of 1,
+    # large universes spend more time on pool IPC round-trips than work.
+    # ~4 chunks per worker keeps the pool load-balanced at the tail.
+    chunksize = max(1, len(csv_files) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(tqdm(executor.map(worker, csv_files, chunksize=chunksize),
+                            total=len(csv_files), desc="Processing tickers"))
+
+    successful = sum(ok for ok, _ in results)
+    failed = len(results) - successful
+
+    # If combining, keep the in-memory frames the workers returned
+    if args.combine:
+        all_data = [dfp for ok, dfp in results if ok and dfp is not None]
     
     print()
     print("="*60)
@@ -133,8 +146,8 @@ def main():
     # Combine all data if requested
     if args.combine and all_data:
         combined_df = pd.concat(all_data, ignore_index=True)
-        combined_path = output_path / "combined_training_data.csv"
-        combined_df.to_csv(combined_path, index=False)
+        combined_path = output_path / "combined_training_data.parquet"
+        combined_df.to_parquet(combined_path, index=False, compression='snappy')
         print(f"\nCombined data saved to: {combined_path}")
         print(f"Total samples: {len(combined_df)}")
     
@@ -8,6 +8,7 @@ Plays back historical data day-by-day (1 day per second) showing:
 - Strategy credibility under market conditions
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Generator
@@ -48,14 +49,33 @@ class RealtimeSimulator:
         split_point = int(len(self.data) * 0.7)  # 70% train, 30% simulate
         self.training_data = self.data.iloc[:split_point]
         self.simulation_data = self.data.iloc[split_point:]
-        
-        # State
+        self._split_point = split_point
+
+        # The indicators are causal (bar t only reads bars <= t), so
+        # running the strategy once over the full history gives every step
+        # exactly the signal it would have computed from its own growing
+        # prefix — without re-concatenating and re-running per day, which
+        # made the simulation O(N^2).
+        self._signals_df = self.strategy.generate_signals(self.data)
+        self._indicator_cols = [
+            col for col in self._signals_df.columns
+            if col not in ('Open', 'High', 'Low', 'Close', 'Volume', 'Signal')
+        ]
+        # Contiguous arrays for the per-step reads — ndarray indexing
+        # instead of a pandas scalar indexer per column per day
+        self._signal_arr = self._signals_df['Signal'].to_numpy()
+        self._indicator_values_arr = (
+            self._signals_df[self._indicator_cols].to_numpy(dtype=np.float64)
+            if self._indicator_cols else None
+        )
+
+        # State (equity history is preallocated — the simulation length
+        # is known up front, so no per-step list growth)
         self.current_index = 0
         self.capital = initial_capital
         self.position = 0
         self.trades = []
-        self.equity_history = []
-        self.indicator_history = []
+        self.equity_history = np.empty(len(self.simulation_data), dtype=np.float64)
         
     def get_simulation_info(self) -> Dict[str, Any]:
         """Get information about the simulation period."""
@@ -84,25 +104,19 @@ class RealtimeSimulator:
         if self.current_index >= len(self.simulation_data):
             return None  # Simulation complete
         
-        # Get current data point
+        # Get current data point (signals were precomputed in __init__)
+        row_idx = self._split_point + self.current_index
         current_date = self.simulation_data.index[self.current_index]
         current_row = self.simulation_data.iloc[self.current_index]
+        current_signal = self._signal_arr[row_idx]
         
-        # Calculate indicators using data up to current point
-        historical_data = pd.concat([
-            self.training_data,
-            self.simulation_data.iloc[:self.current_index + 1]
-        ])
-        
-        # Generate signals
-        df_with_signals = self.strategy.generate_signals(historical_data)
-        current_signal = df_with_signals.iloc[-1]['Signal']
-        
-        # Get indicator values
-        indicator_values = {}
-        for col in df_with_signals.columns:
-            if col not in ['Open', 'High', 'Low', 'Close', 'Volume', 'Signal']:
-                indicator_values[col] = float(df_with_signals.iloc[-1][col])
+        # Get indicator values from the precomputed array row
+        if self._indicator_values_arr is not None:
+            indicator_values = dict(
+                zip(self._indicator_cols, self._indicator_values_arr[row_idx].tolist())
+            )
+        else:
+            indicator_values = {}
         
         # Execute trade based on signal
         price = float(current_row['Close'])
@@ -132,13 +146,7 @@ class RealtimeSimulator:
         
         # Calculate current equity
         current_equity = self.capital + (self.position * price)
-        self.equity_history.append(current_equity)
-        
-        # Store indicator values
-        self.indicator_history.append({
-            'date': str(current_date),
-            'indicators': indicator_values
-        })
+        self.equity_history[self.current_index] = current_equity
         
         # Prepare state
         state = {
@@ -174,9 +182,29 @@ class RealtimeSimulator:
                 break
             yield state
     
+    @property
+    def indicator_history(self) -> List[Dict[str, Any]]:
+        """Per-day indicator values, materialized on demand.
+
+        The data is already a slice of the precomputed indicator array,
+        so nothing is stored per step — the dicts are only boxed here.
+        """
+        days = self.current_index
+        dates = self.simulation_data.index[:days]
+        if self._indicator_values_arr is None:
+            return [{'date': str(date), 'indicators': {}} for date in dates]
+        rows = self._indicator_values_arr[self._split_point:self._split_point + days]
+        return [
+            {'date': str(date),
+             'indicators': dict(zip(self._indicator_cols, row.tolist()))}
+            for date, row in zip(dates, rows)
+        ]
+
     def get_final_results(self) -> Dict[str, Any]:
         """Get final simulation results."""
-        final_equity = self.equity_history[-1] if self.equity_history else self.initial_capital
+        days = self.current_index
+        equity = self.equity_history[:days]
+        final_equity = float(equity[-1]) if days else self.initial_capital
         
         return {
             'initial_capital': self.initial_capital,
@@ -185,10 +213,10 @@ class RealtimeSimulator:
             'return_percentage': ((final_equity - self.initial_capital) / self.initial_capital) * 100,
             'total_trades': len(self.trades),
             'trades': self.trades,
-            'equity_curve': self.equity_history,
-            'max_equity': max(self.equity_history) if self.equity_history else self.initial_capital,
-            'min_equity': min(self.equity_history) if self.equity_history else self.initial_capital,
-            'days_simulated': len(self.equity_history)
+            'equity_curve': equity.tolist(),
+            'max_equity': float(equity.max()) if days else self.initial_capital,
+            'min_equity': float(equity.min()) if days else self.initial_capital,
+            'days_simulated': days
         }
     
     def reset(self):
@@ -197,8 +225,7 @@ class RealtimeSimulator:
         self.capital = self.initial_capital
         self.position = 0
         self.trades = []
-        self.equity_history = []
-        self.indicator_history = []
+        self.equity_history = np.empty(len(self.simulation_data), dtype=np.float64)
 
 
 def simulate_with_playback(ticker: str, strategy: Strategy, 
@@ -227,22 +254,39 @@ def simulate_with_playback(ticker: str, strategy: Strategy,
     
     time.sleep(2)
     
+    # Buffer the per-day lines and write in batches: a print+flush per day
+    # is a syscall per day, which dominates at high playback speeds. The
+    # buffer drains every ~100 ms, when it passes 4 KiB, or on a trade, so
+    # the display still feels live.
+    line_buf = []
+    buf_len = 0
+    last_flush = time.monotonic()
     for state in simulator.run_full_simulation():
-        # Print current state
-        print(f"\r[Day {state['day']}/{state['total_days']}] "
-              f"{state['date']} | "
-              f"Price: ${state['price']:.2f} | "
-              f"Equity: ${state['equity']:,.2f} | "
-              f"Return: {state['return_pct']:+.2f}%", 
-              end='', flush=True)
-        
-        # Show trade execution
+        line = (f"\r[Day {state['day']}/{state['total_days']}] "
+                f"{state['date']} | "
+                f"Price: ${state['price']:.2f} | "
+                f"Equity: ${state['equity']:,.2f} | "
+                f"Return: {state['return_pct']:+.2f}%")
         if state['trade']:
-            print(f"\n>>> {state['trade']['type']} @ ${state['trade']['price']:.2f}")
+            line += f"\n>>> {state['trade']['type']} @ ${state['trade']['price']:.2f}\n"
+        line_buf.append(line)
+        buf_len += len(line)
+        
+        now = time.monotonic()
+        if state['trade'] or buf_len >= 4096 or now - last_flush >= 0.1:
+            sys.stdout.write(''.join(line_buf))
+            sys.stdout.flush()
+            line_buf.clear()
+            buf_len = 0
+            last_flush = now
         
         # Wait for next day
         time.sleep(1 / speed)
     
+    if line_buf:
+        sys.stdout.write(''.join(line_buf))
+        sys.stdout.flush()
+    
     print("\n\n" + "="*60)
     print("SIMULATION COMPLETE")
     print("="*60)
@@ -1,3 +1,7 @@
+import numpy as np
+
+from engine._backtest_kernels import simulate
+
 class SimpleBacktester:
     def __init__(self, initial_capital=10000):
         self.initial_capital = initial_capital
@@ -5,50 +9,55 @@ class SimpleBacktester:
         self.position = 0
         self.trades = []
         self.equity_curve = []
-    
+
     def run(self, signals):
-        """Run backtest on signals"""
-        self.capital = self.initial_capital
-        self.position = 0
+        """Run backtest on a list of signal dicts (legacy interface)."""
+        # AoS -> SoA once at the boundary, then the array path
+        n = len(signals)
+        prices = np.fromiter((s['price'] for s in signals), dtype=np.float64, count=n)
+        sig = np.fromiter((s['signal'] for s in signals), dtype=np.int8, count=n)
+        return self.run_arrays(prices, sig, [s['date'] for s in signals])
+
+    def run_arrays(self, prices, signals, dates):
+        """Array-native run: price/signal arrays straight into the compiled
+        state machine (plain Python when numba is missing); only the
+        returned trades and equity curve are boxed into dicts. Pairs with
+        SimpleStrategy.generate_signals_arrays."""
+        n = len(prices)
+        prices = np.asarray(prices, dtype=np.float64)
+        sig = np.asarray(signals, dtype=np.int8)
+
+        equity, trade_idx, trade_side, trade_price, capital, position = simulate(
+            prices, sig, float(self.initial_capital)
+        )
+        self.capital = capital
+        self.position = position
+
         self.trades = []
-        self.equity_curve = []
-        
-        for signal_data in signals:
-            price = signal_data['price']
-            signal = signal_data['signal']
-            date = signal_data['date']
-            
-            # Execute trades
-            if signal == 1 and self.position == 0:  # Buy
-                self.position = self.capital / price
-                self.capital = 0
+        for i, side, price in zip(trade_idx, trade_side, trade_price):
+            if side == 1:  # Buy: all capital went into the position
                 self.trades.append({
-                    'date': date,
+                    'date': dates[i],
                     'type': 'BUY',
                     'price': price,
-                    'shares': self.position
+                    'shares': equity[i] / price
                 })
-            elif signal == -1 and self.position > 0:  # Sell
-                self.capital = self.position * price
-                self.position = 0
+            else:  # Sell: equity at the bar is the cash received
                 self.trades.append({
-                    'date': date,
+                    'date': dates[i],
                     'type': 'SELL',
                     'price': price,
-                    'value': self.capital
+                    'value': equity[i]
                 })
-            
-            # Calculate current equity
-            current_equity = self.capital + (self.position * price)
-            self.equity_curve.append({
-                'date': date,
-                'equity': current_equity,
-                'price': price
-            })
-        
+
+        self.equity_curve = [
+            {'date': dates[i], 'equity': equity[i], 'price': prices[i]}
+            for i in range(n)
+        ]
+
         return {
             'initial_capital': self.initial_capital,
-            'final_equity': self.equity_curve[-1]['equity'] if self.equity_curve else self.initial_capital,
+            'final_equity': equity[-1] if n else self.initial_capital,
             'trades': self.trades,
             'equity_curve': self.equity_curve
-        }
\ No newline at end of file
+        }
@@ -8,10 +8,49 @@ This approach:
 4. Returns recommendations based on thresholds
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _failure_prob(returns):
+    """Single-pass volatility -> failure probability kernel."""
+    n = returns.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += returns[i]
+    mean /= n
+    var = 0.0
+    for i in range(n):
+        d = returns[i] - mean
+        var += d * d
+    volatility = (var / n) ** 0.5
+    if volatility > 0.05:
+        return 0.8
+    elif volatility > 0.03:
+        return 0.5
+    return 0.2
+
+
+if NUMBA_AVAILABLE:
+    # Warm-up compile so the first /analyze request doesn't pay JIT cost
+    _failure_prob(np.zeros(2, dtype=np.float64))
+
 class SimpleFalsifier:
     def __init__(self, failure_threshold: float = 0.6):
         """
@@ -60,7 +99,8 @@ class SimpleFalsifier:
         recommendation = self._generate_recommendation(trigger_counts, failure_periods)
         
         return {
-            'failure_rate': len(failure_periods) / len(equity_curve) if equity_curve else 0,
+            'failure_rate': len(failure_periods) / len(equity_curve) if len(equity_curve) else 0,
+            'max_drawdown_pct': self._max_drawdown(equity_curve),
             'correlated_events': correlated_events,
             'trigger_counts': trigger_counts,
             'recommendation': recommendation,
@@ -68,47 +108,67 @@ class SimpleFalsifier:
         }
     
     def _identify_failure_periods(self, equity_curve: List[float]) -> List[Dict]:
-        """Identify periods where equity decreased."""
-        failures = []
-        
-        for i in range(1, len(equity_curve)):
-            if equity_curve[i] < equity_curve[i-1]:
-                failures.append({
-                    'index': i,
-                    'drop_amount': equity_curve[i-1] - equity_curve[i],
-                    'drop_percentage': (equity_curve[i-1] - equity_curve[i]) / equity_curve[i-1]
-                })
-        
-        return failures
+        """Identify periods where equity decreased (vectorized)."""
+        eq = np.asarray(equity_curve, dtype=np.float64)
+        if eq.shape[0] < 2:
+            return []
+        
+        # One SIMD pass over the curve instead of a Python comparison per bar
+        drops = np.diff(eq)
+        idx = np.nonzero(drops < 0)[0] + 1
+        prev = eq[idx - 1]
+        amounts = prev - eq[idx]
+        percentages = amounts / prev
+        return [
+            {'index': int(i), 'drop_amount': float(a), 'drop_percentage': float(p)}
+            for i, a, p in zip(idx, amounts, percentages)
+        ]
+
+    @staticmethod
+    def _max_drawdown(equity_curve) -> float:
+        """Max peak-to-trough drawdown via a running-maximum scan."""
+        eq = np.asarray(equity_curve, dtype=np.float64)
+        if eq.shape[0] < 2:
+            return 0.0
+        peak = np.maximum.accumulate(eq)
+        return float(((eq - peak) / peak).min())
     
     def _cross_reference_events(self, failure_periods: List[Dict], trades: List[Dict]) -> List[Dict]:
-        """Cross-reference failure periods with macro events."""
-        correlated = []
-        
-        for failure in failure_periods:
-            # Find trades around this failure
-            failure_idx = failure['index']
-            
-            # Check if any macro events occurred around this time
-            # (In real implementation, you'd match dates from trades to events)
-            for event in self.macro_events:
-                correlated.append({
-                    'failure': failure,
-                    'event': event,
-                    'correlation_strength': 'high'  # Could be calculated based on timing
-                })
-        
-        return correlated
+        """Cross-reference failure periods with macro events.
+
+        There is no timing logic yet (failure periods carry curve indices,
+        not dates), so every event correlates with every failure. Rather
+        than materializing that F x E cross product of dicts, each event
+        appears once with the failure count it matched — same information,
+        E entries instead of F*E.
+        """
+        if not failure_periods or not self.macro_events:
+            return []
+        
+        n_failures = len(failure_periods)
+        return [
+            {
+                'event': event,
+                'failure_count': n_failures,
+                'correlation_strength': 'high'  # Could be calculated based on timing
+            }
+            for event in self.macro_events
+        ]
     
     def _count_triggers(self, correlated_events: List[Dict]) -> Dict[str, int]:
         """Count occurrences of different event types during failures."""
-        trigger_counts = {}
-        
-        for item in correlated_events:
-            event_category = item['event'].get('category', 'unknown')
-            trigger_counts[event_category] = trigger_counts.get(event_category, 0) + 1
-        
-        return trigger_counts
+        if not correlated_events:
+            return {}
+        
+        # One grouped reduction over the categories instead of per-item
+        # dict increments
+        categories = np.array([item['event'].get('category', 'unknown')
+                               for item in correlated_events])
+        weights = np.array([item['failure_count'] for item in correlated_events],
+                           dtype=np.int64)
+        unique, inverse = np.unique(categories, return_inverse=True)
+        totals = np.bincount(inverse, weights=weights).astype(np.int64)
+        return {str(cat): int(total) for cat, total in zip(unique, totals)}
     
     def _generate_recommendation(self, trigger_counts: Dict[str, int], 
                                  failure_periods: List[Dict]) -> str:
@@ -136,23 +196,16 @@ class SimpleFalsifier:
         
         return "Strategy shows failures but no clear correlation with macro events."
     
-    def predict_failure_probability(self, recent_returns: List[float]) -> float:
+    def predict_failure_probability(self, recent_returns) -> float:
         """
         Simple heuristic: calculate failure probability based on recent volatility.
         No ML needed - just statistical analysis.
+
+        Accepts any array-like of returns (list or ndarray).
         """
         if len(recent_returns) < 5:
             return 0.5
         
-        # Calculate volatility (standard deviation)
-        import numpy as np
-        volatility = np.std(recent_returns)
-        
-        # High volatility = higher failure probability
-        # This is a simple heuristic, adjust thresholds as needed
-        if volatility > 0.05:
-            return 0.8
-        elif volatility > 0.03:
-            return 0.5
-        else:
-            return 0.2
+        # High volatility = higher failure probability; the thresholded
+        # std-dev lives in the JIT'd kernel above
+        return float(_failure_prob(np.asarray(recent_returns, dtype=np.float64)))
@@ -1,46 +1,66 @@
+import numpy as np
+
 class SimpleStrategy:
     def __init__(self, short_window=5, long_window=20):
         self.short_window = short_window
         self.long_window = long_window
-    
+
     def calculate_sma(self, prices, window):
         """Calculate Simple Moving Average"""
-        if len(prices) < window:
-            return [0] * len(prices)
-        
-        sma = []
-        for i in range(len(prices)):
-            if i < window - 1:
-                sma.append(0)
-            else:
-                avg = sum(prices[i-window+1:i+1]) / window
-                sma.append(avg)
+        arr = np.asarray(prices, dtype=np.float64)
+        sma = np.zeros(len(arr))
+        if len(arr) >= window:
+            # One convolution replaces the per-index sum over the window
+            sma[window - 1:] = np.convolve(arr, np.ones(window) / window, mode='valid')
         return sma
-    
+
+    def generate_signals_arrays(self, close, dates=None):
+        """SoA fast path: signals straight from a close-price array.
+
+        Returns a column dict of parallel arrays ('date', 'price',
+        'short_sma', 'long_sma', 'signal') — no per-row dict boxing, so
+        downstream array consumers touch only contiguous memory.
+        """
+        close = np.asarray(close, dtype=np.float64)
+
+        short_sma = self.calculate_sma(close, self.short_window)
+        long_sma = self.calculate_sma(close, self.long_window)
+
+        # Crossovers as whole-array comparisons; warm-up bars where either
+        # SMA is still 0 can't signal, same as the old per-row guard
+        signal = np.zeros(len(close), dtype=np.int8)
+        if len(close) > 1:
+            valid = (short_sma[1:] > 0) & (long_sma[1:] > 0)
+            cross_up = (short_sma[1:] > long_sma[1:]) & (short_sma[:-1] <= long_sma[:-1])
+            cross_down = (short_sma[1:] < long_sma[1:]) & (short_sma[:-1] >= long_sma[:-1])
+            signal[1:][valid & cross_up] = 1
+            signal[1:][valid & cross_down] = -1
+
+        return {
+            'date': dates,
+            'price': close,
+            'short_sma': short_sma,
+            'long_sma': long_sma,
+            'signal': signal
+        }
+
     def generate_signals(self, data):
-        """Generate buy/sell signals based on SMA crossover"""
-        prices = [row['Close'] for row in data]
-        
-        short_sma = self.calculate_sma(prices, self.short_window)
-        long_sma = self.calculate_sma(prices, self.long_window)
-        
-        signals = []
-        for i in range(len(data)):
-            signal = 0
-            if i > 0 and short_sma[i] > 0 and long_sma[i] > 0:
-                # Buy when short SMA crosses above long SMA
-                if short_sma[i] > long_sma[i] and short_sma[i-1] <= long_sma[i-1]:
-                    signal = 1
-                # Sell when short SMA crosses below long SMA
-                elif short_sma[i] < long_sma[i] and short_sma[i-1] >= long_sma[i-1]:
-                    signal = -1
-            
-            signals.append({
-                'date': data[i]['Date'],
-                'price': data[i]['Close'],
-                'short_sma': short_sma[i],
-                'long_sma': long_sma[i],
-                'signal': signal
-            })
-        
-        return signals
\ No newline at end of file
+        """Generate buy/sell signals based on SMA crossover.
+
+        Legacy list-of-dicts interface: converts rows to arrays at entry,
+        runs the SoA path, and boxes dicts back only at this boundary.
+        """
+        cols = self.generate_signals_arrays(
+            np.asarray([row['Close'] for row in data], dtype=np.float64),
+            [row['Date'] for row in data]
+        )
+        return [
+            {
+                'date': cols['date'][i],
+                'price': cols['price'][i],
+                'short_sma': cols['short_sma'][i],
+                'long_sma': cols['long_sma'][i],
+                'signal': int(cols['signal'][i])
+            }
+            for i in range(len(data))
+        ]
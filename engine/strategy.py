@@ -1,7 +1,46 @@
+from collections import deque
 from typing import List, Dict, Any
+import numpy as np
 import pandas as pd
 
+from engine._indicator_kernels import _macd, _rsi, _sma
+
+# Computed indicator columns keyed on (indicator type, params, data
+# fingerprint). Parameter sweeps call generate_signals with the same
+# frame under hundreds of strategies that share indicators; the repeat
+# calculate() calls become dict hits. A WeakValueDictionary would not
+# hold anything here — callers copy the values into their own frame and
+# keep no reference to the Series — so this is a small bounded dict with
+# oldest-entry eviction.
+_INDICATOR_CACHE: Dict[tuple, Any] = {}
+_INDICATOR_CACHE_MAX = 256
+
+def _indicator_cache_key(ind: 'Indicator', df: pd.DataFrame) -> tuple:
+    """Fingerprint cheap enough to compute per call: type + params plus
+    length, the tail of the index bytes and the last 16 closes as raw
+    bytes. A single last-close float was not enough — two tickers on the
+    same trading calendar share the length and index tail, and
+    cent-quantized closes coincide often enough to serve one ticker's
+    indicator columns for another. Sixteen closes make that vanishingly
+    unlikely while keeping the key O(1)."""
+    n = len(df)
+    return (
+        type(ind).__name__,
+        tuple(sorted(ind.params.items())),
+        n,
+        df.index.values.tobytes()[-64:] if n else b'',
+        df['Close'].to_numpy()[-16:].tobytes() if n else b'',
+    )
+
 class Indicator:
+    """Indicator base.
+
+    calculate() is the batch path. init_state()/update() are the
+    streaming path for per-tick consumers: init_state seeds a state
+    object from history and update advances it by one close in O(1).
+    State lives in the returned object — never on the indicator — so the
+    shared instances the strategy cache hands out stay stateless.
+    """
     def __init__(self, name: str, params: Dict[str, Any]):
         self.name = name
         self.params = params
@@ -9,19 +48,69 @@ class Indicator:
     def calculate(self, df: pd.DataFrame) -> pd.Series:
         raise NotImplementedError
 
+    def init_state(self, df: pd.DataFrame) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def update(self, state: Dict[str, Any], new_close: float) -> float:
+        raise NotImplementedError
+
 class SMA(Indicator):
     def calculate(self, df: pd.DataFrame) -> pd.Series:
         window = self.params.get('window', 14)
-        return df['Close'].rolling(window=window).mean()
+        close = df['Close'].to_numpy(dtype=np.float32)
+        return pd.Series(_sma(close, window), index=df.index)
+
+    def init_state(self, df: pd.DataFrame) -> Dict[str, Any]:
+        window = self.params.get('window', 14)
+        buf = deque(df['Close'].to_numpy(dtype=np.float64)[-window:], maxlen=window)
+        return {'buf': buf, 'sum': float(sum(buf))}
+
+    def update(self, state: Dict[str, Any], new_close: float) -> float:
+        buf = state['buf']
+        if len(buf) == buf.maxlen:
+            state['sum'] -= buf[0]
+        buf.append(new_close)
+        state['sum'] += new_close
+        if len(buf) < buf.maxlen:
+            return float('nan')
+        return state['sum'] / buf.maxlen
 
 class RSI(Indicator):
     def calculate(self, df: pd.DataFrame) -> pd.Series:
+        # Wilder recursion in one compiled pass (ewm alpha=1/window,
+        # adjust=False), replacing the rolling-mean approximation
         window = self.params.get('window', 14)
-        delta = df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        close = df['Close'].to_numpy(dtype=np.float32)
+        return pd.Series(_rsi(close, window), index=df.index)
+
+    def init_state(self, df: pd.DataFrame) -> Dict[str, Any]:
+        # Wilder state is two EWMAs, so seeding is a replay of history
+        # through update() — same shape as MACD.init_state
+        window = self.params.get('window', 14)
+        state = {'alpha': 1.0 / window,
+                 'avg_gain': None, 'avg_loss': None, 'last': None}
+        for close in df['Close'].to_numpy(dtype=np.float64):
+            self.update(state, close)
+        return state
+
+    def update(self, state: Dict[str, Any], new_close: float) -> float:
+        if state['last'] is None:
+            state['last'] = new_close
+            return float('nan')
+        delta = new_close - state['last']
+        state['last'] = new_close
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if state['avg_gain'] is None:
+            state['avg_gain'] = gain
+            state['avg_loss'] = loss
+        else:
+            state['avg_gain'] += state['alpha'] * (gain - state['avg_gain'])
+            state['avg_loss'] += state['alpha'] * (loss - state['avg_loss'])
+        if state['avg_loss'] <= 0.0:
+            return float('nan') if state['avg_gain'] <= 0.0 else 100.0
+        rs = state['avg_gain'] / state['avg_loss']
+        return 100.0 - 100.0 / (1.0 + rs)
 
 class MACD(Indicator):
     def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -29,17 +118,43 @@ class MACD(Indicator):
         slow = self.params.get('slow', 26)
         signal = self.params.get('signal', 9)
         
-        exp1 = df['Close'].ewm(span=fast, adjust=False).mean()
-        exp2 = df['Close'].ewm(span=slow, adjust=False).mean()
-        macd = exp1 - exp2
-        signal_line = macd.ewm(span=signal, adjust=False).mean()
-        histogram = macd - signal_line
+        close = df['Close'].to_numpy(dtype=np.float32)
+        macd, signal_line, histogram = _macd(close, fast, slow, signal)
         
         return pd.DataFrame({
             f"MACD_{fast}_{slow}": macd,
             f"MACD_Signal_{signal}": signal_line,
             f"MACD_Hist": histogram
-        })
+        }, index=df.index)
+
+    def init_state(self, df: pd.DataFrame) -> Dict[str, Any]:
+        fast = self.params.get('fast', 12)
+        slow = self.params.get('slow', 26)
+        signal = self.params.get('signal', 9)
+        state = {
+            'alpha_fast': 2.0 / (fast + 1.0),
+            'alpha_slow': 2.0 / (slow + 1.0),
+            'alpha_sig': 2.0 / (signal + 1.0),
+            'ema_fast': None, 'ema_slow': None, 'ema_sig': None,
+        }
+        for close in df['Close'].to_numpy(dtype=np.float64):
+            self.update(state, close)
+        return state
+
+    def update(self, state: Dict[str, Any], new_close: float):
+        """Advance the three EMAs; returns (macd, signal_line, histogram)."""
+        if state['ema_fast'] is None:
+            state['ema_fast'] = new_close
+            state['ema_slow'] = new_close
+        else:
+            state['ema_fast'] += state['alpha_fast'] * (new_close - state['ema_fast'])
+            state['ema_slow'] += state['alpha_slow'] * (new_close - state['ema_slow'])
+        macd = state['ema_fast'] - state['ema_slow']
+        if state['ema_sig'] is None:
+            state['ema_sig'] = macd
+        else:
+            state['ema_sig'] += state['alpha_sig'] * (macd - state['ema_sig'])
+        return macd, state['ema_sig'], macd - state['ema_sig']
 
 class Strategy:
     def __init__(self, indicators: List[Indicator], rules: List[Dict]):
@@ -47,79 +162,79 @@ class Strategy:
         self.rules = rules
 
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-        
-        # 1. Calculate all indicators
+        # 1. Calculate all indicators (cached across strategies sharing
+        # the same indicator on the same data). New columns accumulate in
+        # a dict and join the input through a single concat — the old
+        # df.copy() duplicated every input column up front, and each
+        # per-column assignment after it re-consolidated the blocks.
+        new_cols = {}
         for ind in self.indicators:
-            result = ind.calculate(df)
+            key = _indicator_cache_key(ind, df)
+            result = _INDICATOR_CACHE.get(key)
+            if result is None:
+                result = ind.calculate(df)
+                if len(_INDICATOR_CACHE) >= _INDICATOR_CACHE_MAX:
+                    _INDICATOR_CACHE.pop(next(iter(_INDICATOR_CACHE)))
+                _INDICATOR_CACHE[key] = result
             if isinstance(result, pd.Series):
-                df[ind.name] = result
+                new_cols[ind.name] = result
             else:
                 for col in result.columns:
-                    df[col] = result[col]
+                    new_cols[col] = result[col]
         
-        # 2. Initialize Signal column
-        df['Signal'] = 0
+        df = pd.concat([df, pd.DataFrame(new_cols, index=df.index)], axis=1)
         
-        # 3. Apply Rules
+        # 2. Apply Rules as whole-column boolean masks
         # Rules format: {"type": "buy/sell", "condition": "indicator > value", "indicator": "RSI", "operator": ">", "value": 70}
         # Or crossover: {"type": "buy", "condition": "crossover", "ind1": "MACD", "ind2": "MACD_Signal"}
-        
-        for i in range(1, len(df)):
-            buy_conditions = [r for r in self.rules if r['type'] == 'buy']
-            sell_conditions = [r for r in self.rules if r['type'] == 'sell']
-            
-            # Check Buy Rules
-            buy_triggered = False
-            if buy_conditions:
-                buy_triggered = True
-                for rule in buy_conditions:
-                    if not self._check_rule(df, i, rule):
-                        buy_triggered = False
-                        break
-            
-            # Check Sell Rules
-            sell_triggered = False
-            if sell_conditions:
-                sell_triggered = True
-                for rule in sell_conditions:
-                    if not self._check_rule(df, i, rule):
-                        sell_triggered = False
-                        break
-            
-            if buy_triggered:
-                df.iloc[i, df.columns.get_loc('Signal')] = 1
-            elif sell_triggered:
-                df.iloc[i, df.columns.get_loc('Signal')] = -1
-                
+        # All buy rules AND together (same for sell), buy wins over sell,
+        # and bar 0 never signals — identical to the old per-row loop, but
+        # as a handful of array ops instead of N pandas scalar lookups.
+        n = len(df)
+        signal = np.zeros(n, dtype=np.int8)
+        if n > 1:
+            buy_mask = self._rules_mask(df, 'buy', n)
+            sell_mask = self._rules_mask(df, 'sell', n)
+            signal[1:] = np.where(buy_mask[1:], 1, np.where(sell_mask[1:], -1, 0))
+        df['Signal'] = signal
         return df
 
-    def _check_rule(self, df: pd.DataFrame, i: int, rule: Dict) -> bool:
+    def _rules_mask(self, df: pd.DataFrame, rule_type: str, n: int) -> np.ndarray:
+        """AND of the per-rule masks of one type; all-False with no rules."""
+        rules = [r for r in self.rules if r['type'] == rule_type]
+        if not rules:
+            return np.zeros(n, dtype=bool)
+        return np.logical_and.reduce([self._rule_mask(df, rule, n) for rule in rules])
+
+    def _rule_mask(self, df: pd.DataFrame, rule: Dict, n: int) -> np.ndarray:
+        """Boolean mask of the bars where one rule holds (False where it
+        can't be evaluated, mirroring the old per-row exception guard)."""
         try:
+            out = np.zeros(n, dtype=bool)
+            condition = rule.get('condition')
+
+            if condition == 'crossover':
+                a = df[rule.get('ind1')].to_numpy()
+                b = df[rule.get('ind2')].to_numpy()
+                # Cross above: prev ind1 < prev ind2 AND curr ind1 > curr ind2
+                out[1:] = (a[:-1] < b[:-1]) & (a[1:] > b[1:])
+                return out
+
+            if condition == 'crossunder':
+                a = df[rule.get('ind1')].to_numpy()
+                b = df[rule.get('ind2')].to_numpy()
+                out[1:] = (a[:-1] > b[:-1]) & (a[1:] < b[1:])
+                return out
+
+            # Simple threshold rules (NaN compares False, as before)
             op = rule.get('operator')
-            ind = rule.get('indicator')
             val = rule.get('value')
-            
-            if rule.get('condition') == 'crossover':
-                ind1 = rule.get('ind1')
-                ind2 = rule.get('ind2')
-                # Cross above: prev ind1 < prev ind2 AND curr ind1 > curr ind2
-                return (df[ind1].iloc[i-1] < df[ind2].iloc[i-1] and 
-                        df[ind1].iloc[i] > df[ind2].iloc[i])
-            
-            if rule.get('condition') == 'crossunder':
-                ind1 = rule.get('ind1')
-                ind2 = rule.get('ind2')
-                return (df[ind1].iloc[i-1] > df[ind2].iloc[i-1] and 
-                        df[ind1].iloc[i] < df[ind2].iloc[i])
-
-            # Simple threshold rules
-            curr_val = df[ind].iloc[i]
-            if op == '>': return curr_val > val
-            if op == '<': return curr_val < val
-            if op == '>=': return curr_val >= val
-            if op == '<=': return curr_val <= val
-            
-        except Exception as e:
-            return False
-        return False
+            col = df[rule.get('indicator')].to_numpy()
+            if op == '>': return col > val
+            if op == '<': return col < val
+            if op == '>=': return col >= val
+            if op == '<=': return col <= val
+
+        except Exception:
+            return np.zeros(n, dtype=bool)
+        return out
@@ -10,9 +10,11 @@ Usage:
     python engine/train_advanced.py --data_dir ./data/training/processed --epochs 300
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import torch
 import torch.nn as nn
-import torch.optim as optim
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -20,130 +22,284 @@ import argparse
 from tqdm import tqdm
 from sklearn.model_selection import train_test_split
 
+try:
+    import pyarrow.dataset as pa_ds
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow is optional
+    PYARROW_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:  # pragma: no cover - bottleneck is optional
+    BOTTLENECK_AVAILABLE = False
+
 from advanced_falsifier import (
     LSTMPredictor, ComplexPatternNet, AnomalyDetector, AdvancedFalsifier
 )
+from _train_utils import setup_training
+
+# Let the FP32 matmuls that stay outside autocast use TF32 tensor cores
+torch.set_float32_matmul_precision('high')
+
+def _parse_training_file(data_file):
+    """Pool worker: one file -> (returns, labels) float32 arrays.
+
+    Returns None for empty or malformed files, mirroring the skips the
+    old serial loop made via its try/except.
+    """
+    try:
+        if data_file.stat().st_size == 0:
+            return None
+        
+        # Prune to the two columns at the parser; files missing them
+        # raise here and get skipped
+        if data_file.suffix == '.parquet':
+            df = pd.read_parquet(data_file, columns=['return', 'label'])
+        else:
+            df = pd.read_csv(data_file, usecols=['return', 'label'],
+                             dtype={'return': np.float32, 'label': np.float32})
+        return (df['return'].to_numpy(dtype=np.float32),
+                df['label'].to_numpy(dtype=np.float32))
+    except Exception:
+        return None
 
 def load_all_data(data_dir: str):
-    """Load all processed CSV files."""
+    """Load all processed data files into two flat float32 arrays."""
     data_path = Path(data_dir)
-    all_returns = []
-    all_labels = []
     
-    csv_files = list(data_path.glob("*.csv"))
-    print(f"Loading {len(csv_files)} files...")
+    data_files = list(data_path.glob("*.parquet")) or list(data_path.glob("*.csv"))
+    print(f"Loading {len(data_files)} files...")
+    data_files = data_files[:500]  # Limit for memory
     
-    for csv_file in tqdm(csv_files[:500], desc="Loading data"):  # Limit for memory
+    if PYARROW_AVAILABLE and data_files and data_files[0].suffix == '.parquet':
+        # One Arrow dataset scan: parallel C++ readers over the whole
+        # shard list and a zero-copy handoff of the contiguous columns,
+        # instead of 500 sequential pd.read_parquet calls
         try:
-            if csv_file.stat().st_size == 0:
-                continue
-            
-            df = pd.read_csv(csv_file)
-            if 'return' not in df.columns or 'label' not in df.columns:
-                continue
-            
-            all_returns.extend(df['return'].values.tolist())
-            all_labels.extend(df['label'].values.tolist())
-        except:
-            continue
+            tbl = pa_ds.dataset(
+                [str(f) for f in data_files], format='parquet'
+            ).to_table(columns=['return', 'label'])
+            return (
+                tbl['return'].to_numpy(zero_copy_only=False).astype(np.float32, copy=False),
+                tbl['label'].to_numpy(zero_copy_only=False).astype(np.float32, copy=False),
+            )
+        except Exception:
+            pass  # Mixed/damaged shards: fall back to the per-file loop
     
-    return np.array(all_returns), np.array(all_labels)
+    # Per-file parsing is CPU-bound and independent, so fan it out one
+    # worker per core with batched task submission — same pool shape as
+    # preprocess_data. Part arrays come back in order and concatenate
+    # once per output.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        chunksize = max(1, len(data_files) // (4 * (os.cpu_count() or 1)))
+        parts = list(tqdm(
+            executor.map(_parse_training_file, data_files, chunksize=chunksize),
+            total=len(data_files), desc="Loading data"
+        ))
+    
+    returns_parts = [part[0] for part in parts if part is not None]
+    labels_parts = [part[1] for part in parts if part is not None]
+    
+    if not returns_parts:
+        return np.array([], dtype=np.float32), np.array([], dtype=np.float32)
+    return np.concatenate(returns_parts), np.concatenate(labels_parts)
 
 def prepare_lstm_sequences(returns, labels, seq_len=10):
-    """Prepare sequences for LSTM training."""
-    X, y = [], []
-    
-    for i in range(len(returns) - seq_len):
-        # Create feature sequence
-        seq_features = []
-        for j in range(i, i + seq_len):
-            features = [
-                returns[j],
-                np.std(returns[max(0, j-5):j+1]) if j > 0 else 0,  # Volatility
-                np.mean(returns[max(0, j-5):j+1]) if j > 0 else 0,  # Trend
-                returns[j-1] if j > 0 else 0,  # Previous return
-                1 if j > 0 and returns[j] < 0 else 0  # Is negative
-            ]
-            seq_features.append(features)
-        
-        X.append(seq_features)
-        y.append(labels[i + seq_len])
+    """Prepare sequences for LSTM training (vectorized).
+
+    The per-timestep features are computed once over the whole series —
+    rolling stats over the same up-to-6-bar trailing window the old
+    nested loop re-reduced per index — then the (seq_len, 5) windows are
+    gathered as strided views and copied into one contiguous block.
+    """
+    r = np.asarray(returns, dtype=np.float32)
+    n = len(r)
+    if n <= seq_len:
+        return (torch.empty((0, seq_len, 5), dtype=torch.float32),
+                torch.empty(0, dtype=torch.uint8))
+    
+    if BOTTLENECK_AVAILABLE:
+        # Incremental C moving windows: one O(N) pass per stat, no
+        # Series wrappers (bn's ddof=0 default matches np.std)
+        vol = bn.move_std(r, 6, min_count=1).astype(np.float32, copy=False)
+        trend = bn.move_mean(r, 6, min_count=1).astype(np.float32, copy=False)
+    else:
+        roll = pd.Series(r).rolling(6, min_periods=1)
+        vol = roll.std(ddof=0).to_numpy(dtype=np.float32)
+        trend = roll.mean().to_numpy(dtype=np.float32)
+    prev = np.concatenate(([0.0], r[:-1])).astype(np.float32)
+    neg = (r < 0).astype(np.float32)
+    # The loop pinned every j == 0 feature (except the return itself) to 0
+    vol[0] = 0.0
+    trend[0] = 0.0
+    neg[0] = 0.0
     
-    return torch.tensor(X, dtype=torch.float32), torch.tensor(y, dtype=torch.float32).unsqueeze(-1)
+    feat = np.stack([r, vol, trend, prev, neg], axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(feat, (seq_len, 5))[:, 0]
+    X = np.ascontiguousarray(windows[:n - seq_len])
+    # uint8 labels with no trailing dim: a quarter of the float32 bytes
+    # through the loader; the loss casts per batch on-device
+    y = np.asarray(labels[seq_len:], dtype=np.uint8)
+    return torch.from_numpy(X), torch.from_numpy(y)
 
 def prepare_pattern_features(returns, labels, window=20):
-    """Prepare features for pattern detector."""
-    X, y = [], []
+    """Prepare features for pattern detector (vectorized).
+
+    Same 20-feature layout as before — first 10 returns of the window,
+    std/mean/last/min/max, trend flag, zero padding — but each stat is
+    one reduction along axis 1 of a strided window view instead of a
+    per-index np.std/mean/min/max call.
+    """
+    r = np.asarray(returns, dtype=np.float32)
+    n = len(r)
+    if n <= window:
+        return (torch.empty((0, 20), dtype=torch.float32),
+                torch.empty(0, dtype=torch.uint8))
     
-    for i in range(window, len(returns)):
-        features = []
-        
-        # Recent returns
-        recent = returns[i-window:i]
-        features.extend(recent[:10].tolist() + [0] * max(0, 10 - len(recent)))
-        
-        # Statistical features
-        features.append(np.std(recent))
-        features.append(np.mean(recent))
-        features.append(recent[-1] if len(recent) > 0 else 0)
-        features.append(np.min(recent))
-        features.append(np.max(recent))
-        
-        # Trend features
-        if len(recent) > 1:
-            features.append(1 if recent[-1] > recent[0] else 0)
-        else:
-            features.append(0)
-        
-        # Pad to 20 features
-        while len(features) < 20:
-            features.append(0)
-        
-        X.append(features[:20])
-        y.append(labels[i])
+    # Windows ending just before each labelled index i = window..n-1
+    win = np.lib.stride_tricks.sliding_window_view(r, window)[:n - window]
+    if BOTTLENECK_AVAILABLE:
+        # O(N) incremental windows; [window-1:-1] aligns each stat with
+        # the window ending just before its labelled index
+        stats = np.stack([
+            bn.move_std(r, window)[window - 1:-1].astype(np.float32, copy=False),
+            bn.move_mean(r, window)[window - 1:-1].astype(np.float32, copy=False),
+            win[:, -1],                                   # Last return
+            bn.move_min(r, window)[window - 1:-1].astype(np.float32, copy=False),
+            bn.move_max(r, window)[window - 1:-1].astype(np.float32, copy=False),
+            (win[:, -1] > win[:, 0]).astype(np.float32),  # Trend flag
+        ], axis=1)
+    else:
+        stats = np.stack([
+            win.std(axis=1),
+            win.mean(axis=1),
+            win[:, -1],                                   # Last return
+            win.min(axis=1),
+            win.max(axis=1),
+            (win[:, -1] > win[:, 0]).astype(np.float32),  # Trend flag
+        ], axis=1)
     
-    return torch.tensor(X, dtype=torch.float32), torch.tensor(y, dtype=torch.float32).unsqueeze(-1)
+    X = np.concatenate([
+        win[:, :10],
+        stats,
+        np.zeros((len(win), 4), dtype=np.float32)     # Pad to 20 features
+    ], axis=1)
+    y = np.asarray(labels[window:], dtype=np.uint8)
+    return torch.from_numpy(np.ascontiguousarray(X)), torch.from_numpy(y)
 
-def train_lstm(model, X_train, y_train, X_test, y_test, epochs=100, batch_size=64):
-    """Train LSTM predictor."""
+class ShardedWindowDataset(torch.utils.data.IterableDataset):
+    """Streams LSTM training windows straight from the data shards.
+
+    Each DataLoader worker takes a strided slice of the shard list and
+    scans its files sequentially, so RAM holds one file's windows at a
+    time and the full corpus trains without the in-memory file cap.
+    Parsing runs in the workers, overlapping the training step.
+    """
+
+    def __init__(self, files, seq_len=10):
+        self.files = list(files)
+        self.seq_len = seq_len
+
+    def __iter__(self):
+        worker = torch.utils.data.get_worker_info()
+        files = (self.files[worker.id::worker.num_workers]
+                 if worker is not None else self.files)
+        for data_file in files:
+            parsed = _parse_training_file(data_file)
+            if parsed is None:
+                continue
+            returns, labels = parsed
+            X, y = prepare_lstm_sequences(returns, labels, self.seq_len)
+            for i in range(len(X)):
+                yield X[i], y[i]
+
+def evaluate_in_chunks(model, criterion, X_test, y_test, device, amp_dtype,
+                       use_amp, batch_size=4096):
+    """Chunked held-out evaluation.
+
+    Pushing the whole test set through in one forward spikes activation
+    memory (and OOMs on GPU for big corpora); 4096-sample chunks keep the
+    peak flat while the loss/accuracy accumulate to the same totals.
+    inference_mode is no_grad minus the version-counter bookkeeping.
+    """
+    total_loss = 0.0
+    correct = 0
+    with torch.inference_mode(), torch.autocast(device_type='cuda',
+                                                dtype=amp_dtype,
+                                                enabled=use_amp):
+        for start in range(0, len(X_test), batch_size):
+            xb = X_test[start:start + batch_size].to(device, non_blocking=True)
+            yb = y_test[start:start + batch_size].to(device, non_blocking=True)
+            out = model(xb).squeeze(-1)
+            total_loss += criterion(out, yb.float()).item() * len(yb)
+            # logit 0 == probability 0.5
+            correct += ((out > 0) == yb.bool()).sum().item()
+    n = y_test.size(0)
+    return total_loss / n, correct / n * 100
+
+def train_lstm(model, train_data, X_test, y_test, epochs=100, batch_size=64):
+    """Train LSTM predictor.
+
+    train_data is either an (X_train, y_train) tensor pair or an
+    already-built DataLoader — the sharded streaming path passes one.
+    """
     print("\n" + "="*60)
     print("Training LSTM Predictor")
     print("="*60)
     
-    criterion = nn.BCELoss()
-    optimizer = optim.Adam(model.parameters(), lr=0.001)
+    # LSTMPredictor emits logits, so use the fused loss and a 0-logit
+    # decision threshold (== probability 0.5). Logits are also what makes
+    # FP16 autocast safe here — BCE on probabilities is not.
+    criterion = nn.BCEWithLogitsLoss()
     
-    dataset = torch.utils.data.TensorDataset(X_train, y_train)
-    dataloader = torch.utils.data.DataLoader(dataset, batch_size=batch_size, shuffle=True)
+    (model, optimizer, device, scaler, amp_dtype, use_amp,
+     loader_kwargs) = setup_training(model, lr=0.001, batch_size=batch_size,
+                                     example_input=X_test[:batch_size])
+    
+    if isinstance(train_data, torch.utils.data.DataLoader):
+        dataloader = train_data
+    else:
+        X_train, y_train = train_data
+        dataset = torch.utils.data.TensorDataset(X_train, y_train)
+        dataloader = torch.utils.data.DataLoader(dataset, **loader_kwargs)
     
     best_acc = 0
     
     for epoch in range(epochs):
         model.train()
         epoch_loss = 0
+        # Counted, not len(dataloader): iterable datasets have no length
+        n_batches = 0
         
         for batch_X, batch_y in dataloader:
-            optimizer.zero_grad()
-            outputs = model(batch_X)
-            loss = criterion(outputs, batch_y)
-            loss.backward()
-            optimizer.step()
+            batch_X = batch_X.to(device, non_blocking=True)
+            batch_y = batch_y.to(device, non_blocking=True)
+            optimizer.zero_grad(set_to_none=True)
+            # Tensor-core forward in the selected AMP dtype; under FP16
+            # the scaler keeps grads out of the denormal range before the
+            # FP32 optimizer step (pass-through under BF16)
+            with torch.autocast(device_type='cuda', dtype=amp_dtype,
+                                enabled=use_amp):
+                outputs = model(batch_X).squeeze(-1)
+                loss = criterion(outputs, batch_y.float())
+            scaler.scale(loss).backward()
+            scaler.step(optimizer)
+            scaler.update()
             epoch_loss += loss.item()
+            n_batches += 1
         
         # Evaluate
         if (epoch + 1) % 20 == 0:
             model.eval()
-            with torch.no_grad():
-                test_outputs = model(X_test)
-                test_loss = criterion(test_outputs, y_test)
-                predicted = (test_outputs > 0.5).float()
-                accuracy = (predicted == y_test).sum().item() / y_test.size(0) * 100
-                
-                if accuracy > best_acc:
-                    best_acc = accuracy
-                
-                print(f"Epoch [{epoch+1}/{epochs}] - Loss: {epoch_loss/len(dataloader):.4f}, "
-                      f"Test Acc: {accuracy:.2f}%, Best: {best_acc:.2f}%")
+            test_loss, accuracy = evaluate_in_chunks(
+                model, criterion, X_test, y_test, device, amp_dtype, use_amp)
+            
+            if accuracy > best_acc:
+                best_acc = accuracy
+            
+            print(f"Epoch [{epoch+1}/{epochs}] - Loss: {epoch_loss/max(n_batches, 1):.4f}, "
+                  f"Test Acc: {accuracy:.2f}%, Best: {best_acc:.2f}%")
     
     return best_acc
 
@@ -153,39 +309,48 @@ def train_pattern_detector(model, X_train, y_train, X_test, y_test, epochs=100,
     print("Training Complex Pattern Detector")
     print("="*60)
     
-    criterion = nn.BCELoss()
-    optimizer = optim.Adam(model.parameters(), lr=0.001)
+    # ComplexPatternNet emits logits too (no terminal sigmoid), so the
+    # fused loss applies and the autocast wrapper is numerically safe
+    criterion = nn.BCEWithLogitsLoss()
+    
+    (model, optimizer, device, scaler, amp_dtype, use_amp,
+     loader_kwargs) = setup_training(model, lr=0.001, batch_size=batch_size,
+                                     example_input=X_test[:batch_size])
     
     dataset = torch.utils.data.TensorDataset(X_train, y_train)
-    dataloader = torch.utils.data.DataLoader(dataset, batch_size=batch_size, shuffle=True)
+    dataloader = torch.utils.data.DataLoader(dataset, **loader_kwargs)
     
     best_acc = 0
     
     for epoch in range(epochs):
         model.train()
         epoch_loss = 0
+        n_batches = 0
         
         for batch_X, batch_y in dataloader:
-            optimizer.zero_grad()
-            outputs = model(batch_X)
-            loss = criterion(outputs, batch_y)
-            loss.backward()
-            optimizer.step()
+            batch_X = batch_X.to(device, non_blocking=True)
+            batch_y = batch_y.to(device, non_blocking=True)
+            optimizer.zero_grad(set_to_none=True)
+            with torch.autocast(device_type='cuda', dtype=amp_dtype,
+                                enabled=use_amp):
+                outputs = model(batch_X).squeeze(-1)
+                loss = criterion(outputs, batch_y.float())
+            scaler.scale(loss).backward()
+            scaler.step(optimizer)
+            scaler.update()
             epoch_loss += loss.item()
+            n_batches += 1
         
         if (epoch + 1) % 20 == 0:
             model.eval()
-            with torch.no_grad():
-                test_outputs = model(X_test)
-                test_loss = criterion(test_outputs, y_test)
-                predicted = (test_outputs > 0.5).float()
-                accuracy = (predicted == y_test).sum().item() / y_test.size(0) * 100
-                
-                if accuracy > best_acc:
-                    best_acc = accuracy
-                
-                print(f"Epoch [{epoch+1}/{epochs}] - Loss: {epoch_loss/len(dataloader):.4f}, "
-                      f"Test Acc: {accuracy:.2f}%, Best: {best_acc:.2f}%")
+            test_loss, accuracy = evaluate_in_chunks(
+                model, criterion, X_test, y_test, device, amp_dtype, use_amp)
+            
+            if accuracy > best_acc:
+                best_acc = accuracy
+            
+            print(f"Epoch [{epoch+1}/{epochs}] - Loss: {epoch_loss/max(n_batches, 1):.4f}, "
+                  f"Test Acc: {accuracy:.2f}%, Best: {best_acc:.2f}%")
     
     return best_acc
 
@@ -204,25 +369,102 @@ def main():
     parser.add_argument('--epochs', type=int, default=200)
     parser.add_argument('--batch_size', type=int, default=64)
     parser.add_argument('--model_dir', type=str, default='./data/models')
+    parser.add_argument('--cache_dir', type=str, default=None,
+                        help='Persist prepared training arrays as .npy and '
+                             'memory-map them on later runs')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream LSTM windows from all shards via an '
+                             'IterableDataset instead of loading the capped '
+                             'corpus into RAM')
     
     args = parser.parse_args()
     
-    # Load data
-    print("Loading training data...")
-    returns, labels = load_all_data(args.data_dir)
-    print(f"Loaded {len(returns)} samples")
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    
+    def load_cached(tag):
+        """Memory-mapped (X, y) pair for a prepared-array cache, or None.
+
+        mmap_mode='c' (copy-on-write) pages batches in lazily, stays
+        writable in RAM only, and skips the not-writable warning a plain
+        read-only mapping triggers in torch.from_numpy.
+        """
+        if cache_dir is None:
+            return None
+        x_path = cache_dir / f"{tag}_X.npy"
+        y_path = cache_dir / f"{tag}_y.npy"
+        if not (x_path.exists() and y_path.exists()):
+            return None
+        return (torch.from_numpy(np.load(x_path, mmap_mode='c')),
+                torch.from_numpy(np.load(y_path, mmap_mode='c')))
+    
+    def save_cached(tag, X, y):
+        if cache_dir is None:
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        np.save(cache_dir / f"{tag}_X.npy", X.numpy())
+        np.save(cache_dir / f"{tag}_y.npy", y.numpy())
+    
+    lstm_cached = None if args.stream else load_cached('lstm')
+    pattern_cached = load_cached('pattern')
+    
+    # Parse the corpus only when something needs rebuilding — with both
+    # caches warm the run skips file parsing entirely. The streaming LSTM
+    # path reads its shards lazily and needs no in-memory corpus.
+    if (lstm_cached is None and not args.stream) or pattern_cached is None:
+        print("Loading training data...")
+        returns, labels = load_all_data(args.data_dir)
+        print(f"Loaded {len(returns)} samples")
     
     # Prepare LSTM data
-    print("\nPreparing LSTM sequences...")
-    X_lstm, y_lstm = prepare_lstm_sequences(returns, labels)
-    X_lstm_train, X_lstm_test, y_lstm_train, y_lstm_test = train_test_split(
-        X_lstm, y_lstm, test_size=0.2, random_state=42
-    )
-    print(f"LSTM: {len(X_lstm_train)} train, {len(X_lstm_test)} test")
+    if args.stream:
+        # Full shard list, no in-memory cap: the first 80% of files feed
+        # the sharded streaming loader, the tail materializes in memory
+        # as the held-out set
+        data_path = Path(args.data_dir)
+        data_files = (sorted(data_path.glob("*.parquet"))
+                      or sorted(data_path.glob("*.csv")))
+        split = max(1, int(0.8 * len(data_files)))
+        stream_loader = torch.utils.data.DataLoader(
+            ShardedWindowDataset(data_files[:split]),
+            batch_size=args.batch_size, num_workers=2,
+            pin_memory=torch.cuda.is_available(),
+            persistent_workers=True, prefetch_factor=4,
+        )
+        test_X_parts, test_y_parts = [], []
+        for data_file in data_files[split:]:
+            parsed = _parse_training_file(data_file)
+            if parsed is None:
+                continue
+            Xf, yf = prepare_lstm_sequences(*parsed)
+            if len(Xf):
+                test_X_parts.append(Xf)
+                test_y_parts.append(yf)
+        X_lstm_test = torch.cat(test_X_parts)
+        y_lstm_test = torch.cat(test_y_parts)
+        lstm_train_data = stream_loader
+        print(f"LSTM: streaming {split} shards, {len(X_lstm_test)} held-out windows")
+    else:
+        if lstm_cached is not None:
+            X_lstm, y_lstm = lstm_cached
+            print(f"Loaded {len(X_lstm)} cached LSTM sequences")
+        else:
+            print("\nPreparing LSTM sequences...")
+            X_lstm, y_lstm = prepare_lstm_sequences(returns, labels)
+            save_cached('lstm', X_lstm, y_lstm)
+        X_lstm_train, X_lstm_test, y_lstm_train, y_lstm_test = train_test_split(
+            X_lstm, y_lstm, test_size=0.2, random_state=42
+        )
+        lstm_train_data = (X_lstm_train, y_lstm_train)
+        print(f"LSTM: {len(X_lstm_train)} train, {len(X_lstm_test)} test")
     
     # Prepare pattern detector data
-    print("\nPreparing pattern features...")
-    X_pattern, y_pattern = prepare_pattern_features(returns, labels)
+    if pattern_cached is not None:
+        X_pattern, y_pattern = pattern_cached
+        print(f"Loaded {len(X_pattern)} cached pattern feature rows")
+    else:
+        print("\nPreparing pattern features...")
+        X_pattern, y_pattern = prepare_pattern_features(returns, labels)
+        save_cached('pattern', X_pattern, y_pattern)
     X_pattern_train, X_pattern_test, y_pattern_train, y_pattern_test = train_test_split(
         X_pattern, y_pattern, test_size=0.2, random_state=42
     )
@@ -234,7 +476,7 @@ def main():
     anomaly_detector = AnomalyDetector()
     
     # Train LSTM
-    lstm_acc = train_lstm(lstm_model, X_lstm_train, y_lstm_train, 
+    lstm_acc = train_lstm(lstm_model, lstm_train_data,
                          X_lstm_test, y_lstm_test, epochs=args.epochs, 
                          batch_size=args.batch_size)
     
@@ -253,6 +495,22 @@ def main():
     torch.save(lstm_model.state_dict(), model_dir / "lstm_predictor.pth")
     torch.save(pattern_model.state_dict(), model_dir / "pattern_detector.pth")
     
+    # Dynamic int8 copies alongside the FP32 weights: inference hosts can
+    # load these directly instead of re-quantizing at startup. FP32 stays
+    # the source of truth for retraining and online updates.
+    try:
+        lstm_q = torch.ao.quantization.quantize_dynamic(
+            lstm_model.cpu(), {nn.LSTM, nn.Linear}, dtype=torch.qint8
+        )
+        pattern_q = torch.ao.quantization.quantize_dynamic(
+            pattern_model.cpu(), {nn.Linear}, dtype=torch.qint8
+        )
+        torch.save(lstm_q.state_dict(), model_dir / "lstm_predictor_int8.pth")
+        torch.save(pattern_q.state_dict(), model_dir / "pattern_detector_int8.pth")
+        print("✓ Saved int8 quantized copies")
+    except Exception as e:
+        print(f"int8 quantization skipped: {e}")
+    
     print("\n" + "="*60)
     print("TRAINING COMPLETE!")
     print("="*60)
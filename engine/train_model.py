@@ -10,7 +10,6 @@ Usage:
 
 import torch
 import torch.nn as nn
-import torch.optim as optim
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -18,13 +17,24 @@ import argparse
 from typing import List, Tuple
 import json
 
+try:
+    import pyarrow  # noqa: F401 - presence check for the csv engine
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow is optional
+    PYARROW_AVAILABLE = False
+
 from falsifier import FalsifierModel
+from _train_utils import setup_training
+
+# Let the FP32 matmuls that stay outside autocast use TF32 tensor cores
+torch.set_float32_matmul_precision('high')
 
 class ModelTrainer:
     def __init__(self, model_save_path: str = "./data/models/falsifier_weights.pth"):
         self.model = FalsifierModel(input_size=1, hidden_size=64, output_size=1)
-        self.criterion = nn.BCELoss()
-        self.optimizer = optim.Adam(self.model.parameters(), lr=0.001)
+        self.criterion = nn.BCEWithLogitsLoss()
+        # Built by train() via setup_training, after the device move
+        self.optimizer = None
         self.model_save_path = model_save_path
         self.training_history = []
         
@@ -45,36 +55,47 @@ class ModelTrainer:
         
         print(f"Loading training data from {data_dir}...")
         
-        # Load all CSV files
-        csv_files = list(data_path.glob("*.csv"))
-        if not csv_files:
-            raise ValueError(f"No CSV files found in {data_dir}")
+        # Load all processed files (parquet preferred, CSV for older runs)
+        data_files = list(data_path.glob("*.parquet")) or list(data_path.glob("*.csv"))
+        if not data_files:
+            raise ValueError(f"No parquet/CSV files found in {data_dir}")
         
-        for csv_file in csv_files:
-            print(f"  Loading {csv_file.name}...")
-            df = pd.read_csv(csv_file)
+        for data_file in data_files:
+            print(f"  Loading {data_file.name}...")
+            if data_file.suffix == '.parquet':
+                df = pd.read_parquet(data_file)
+            else:
+                # Arrow's csv engine parses in parallel C++ threads
+                df = pd.read_csv(data_file,
+                                 engine='pyarrow' if PYARROW_AVAILABLE else 'c')
             
             # Validate columns
             if 'return' not in df.columns or 'label' not in df.columns:
-                print(f"  Warning: Skipping {csv_file.name} - missing 'return' or 'label' columns")
+                print(f"  Warning: Skipping {data_file.name} - missing 'return' or 'label' columns")
                 continue
             
-            returns = df['return'].values
-            labels = df['label'].values
+            returns = df['return'].to_numpy(dtype=np.float32)
+            labels = df['label'].to_numpy(dtype=np.float32)
             
-            # Create sequences (sliding window of 10)
+            # Create sequences (sliding window of 10) as one strided view
+            # per file — the Python loop materialized every window as a
+            # list entry before torch.tensor copied them all again
             seq_len = 10
-            for i in range(len(returns) - seq_len):
-                all_sequences.append(returns[i:i+seq_len])
-                all_labels.append(labels[i+seq_len])
+            if len(returns) <= seq_len:
+                continue
+            windows = np.lib.stride_tricks.sliding_window_view(returns, seq_len)
+            all_sequences.append(windows[:len(returns) - seq_len].copy())
+            all_labels.append(labels[seq_len:])
         
         if not all_sequences:
             raise ValueError("No valid training data found!")
         
-        print(f"Loaded {len(all_sequences)} training sequences from {len(csv_files)} files")
+        X = torch.from_numpy(np.concatenate(all_sequences)).unsqueeze(-1)
+        # uint8 labels with no trailing dim: a quarter of the float32
+        # bytes moved per epoch; the loss casts per batch on-device
+        y = torch.from_numpy(np.concatenate(all_labels).astype(np.uint8))
         
-        X = torch.tensor(all_sequences, dtype=torch.float32).unsqueeze(-1)
-        y = torch.tensor(all_labels, dtype=torch.float32).unsqueeze(-1)
+        print(f"Loaded {len(X)} training sequences from {len(data_files)} files")
         
         return X, y
     
@@ -86,8 +107,15 @@ class ModelTrainer:
         print(f"Training samples: {len(X)}")
         print(f"Model architecture: {self.model}")
         
+        # self.model keeps the eager handle the save path uses; the
+        # returned model is the (possibly compiled) one the loop calls
+        (model, self.optimizer, device, scaler, amp_dtype, use_amp,
+         loader_kwargs) = setup_training(self.model, lr=0.001,
+                                         batch_size=batch_size,
+                                         example_input=X[:batch_size])
+        
         dataset = torch.utils.data.TensorDataset(X, y)
-        dataloader = torch.utils.data.DataLoader(dataset, batch_size=batch_size, shuffle=True)
+        dataloader = torch.utils.data.DataLoader(dataset, **loader_kwargs)
         
         self.model.train()
         
@@ -97,17 +125,22 @@ class ModelTrainer:
             total = 0
             
             for batch_X, batch_y in dataloader:
-                self.optimizer.zero_grad()
-                outputs = self.model(batch_X)
-                loss = self.criterion(outputs, batch_y)
-                loss.backward()
-                self.optimizer.step()
+                batch_X = batch_X.to(device, non_blocking=True)
+                batch_y = batch_y.to(device, non_blocking=True)
+                self.optimizer.zero_grad(set_to_none=True)
+                with torch.autocast(device_type='cuda', dtype=amp_dtype,
+                                    enabled=use_amp):
+                    outputs = model(batch_X).squeeze(-1)
+                    loss = self.criterion(outputs, batch_y.float())
+                scaler.scale(loss).backward()
+                scaler.step(self.optimizer)
+                scaler.update()
                 
                 epoch_loss += loss.item()
                 
                 # Calculate accuracy
-                predicted = (outputs > 0.5).float()
-                correct += (predicted == batch_y).sum().item()
+                predicted = outputs > 0  # logit 0 == probability 0.5
+                correct += (predicted == batch_y.bool()).sum().item()
                 total += batch_y.size(0)
             
             avg_loss = epoch_loss / len(dataloader)
@@ -146,6 +179,18 @@ class ModelTrainer:
         
         print(f"\nModel saved to {save_path}")
         
+        # Dynamic int8 copy for inference hosts; FP32 above stays the
+        # source of truth for retraining
+        try:
+            model_q = torch.ao.quantization.quantize_dynamic(
+                self.model.cpu(), {nn.LSTM, nn.Linear}, dtype=torch.qint8
+            )
+            int8_path = save_path.with_name(save_path.stem + "_int8.pth")
+            torch.save(model_q.state_dict(), int8_path)
+            print(f"Quantized int8 weights saved to {int8_path}")
+        except Exception as e:
+            print(f"int8 quantization skipped: {e}")
+        
         # Save training history as JSON
         history_path = save_path.parent / "training_history.json"
         with open(history_path, 'w') as f:
@@ -158,17 +203,30 @@ class ModelTrainer:
         Evaluate the model on test data.
         """
         self.model.eval()
-        with torch.no_grad():
-            outputs = self.model(X)
-            loss = self.criterion(outputs, y)
-            predicted = (outputs > 0.5).float()
-            accuracy = 100 * (predicted == y).sum().item() / y.size(0)
+        device = next(self.model.parameters()).device
+        
+        # Chunked forward keeps peak activation memory flat on large test
+        # sets; inference_mode is no_grad minus version-counter overhead
+        total_loss = 0.0
+        correct = 0
+        batch_size = 4096
+        with torch.inference_mode():
+            for start in range(0, len(X), batch_size):
+                xb = X[start:start + batch_size].to(device, non_blocking=True)
+                yb = y[start:start + batch_size].to(device, non_blocking=True)
+                outputs = self.model(xb).squeeze(-1)
+                total_loss += self.criterion(outputs, yb.float()).item() * len(yb)
+                predicted = outputs > 0  # logit 0 == probability 0.5
+                correct += (predicted == yb.bool()).sum().item()
+        
+        loss = total_loss / y.size(0)
+        accuracy = 100 * correct / y.size(0)
         
         print(f"\nEvaluation Results:")
-        print(f"  Loss: {loss.item():.4f}")
+        print(f"  Loss: {loss:.4f}")
         print(f"  Accuracy: {accuracy:.2f}%")
         
-        return loss.item(), accuracy
+        return loss, accuracy
 
 
 def main():
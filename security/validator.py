@@ -0,0 +1,189 @@
+"""
+Input validation for user-supplied strings.
+
+Everything that reaches the database already goes through bound
+parameters / the ORM, so this is defense in depth for the free-text
+fields the API stores and echoes back (usernames, tickers) rather than
+the only line of defense.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyahocorasick is optional
+    AHOCORASICK_AVAILABLE = False
+
+# Inputs longer than this are rejected outright instead of scanned —
+# no legitimate field is anywhere near it, and it caps the CPU (and the
+# lru_cache memory) an adversarial payload can claim.
+_MAX_SCAN_LENGTH = 4096
+
+# Fixed fragments: matched by the Aho-Corasick automaton below (one
+# linear pass, no backtracking) when pyahocorasick is installed
+_SQL_INJECTION_LITERALS = ("--", "/*", "*/", ";", "xp_cmdshell")
+
+# Structural fragments that genuinely need a regex
+_SQL_INJECTION_PATTERNS = [
+    r"\bunion\b.{0,40}\bselect\b",
+    r"\bselect\b.{0,40}\bfrom\b",
+    r"\binsert\s+into\b",
+    r"\bdelete\s+from\b",
+    r"\bdrop\s+(?:table|database)\b",
+    r"\bupdate\b.{0,40}\bset\b",
+    r"\bexec(?:ute)?\b",
+    r"['\"]\s*or\s+['\"\d]",
+]
+
+# Compiled once at import. The residual alternation covers only the
+# structural patterns; the full one (literals included) is the fallback
+# when the automaton is unavailable. re.ASCII keeps \b/\s/IGNORECASE on
+# 256-entry byte tables instead of Unicode property lookups — sound here
+# because SQL keywords are ASCII and normalize_unicode runs NFKC first,
+# which folds fullwidth letters and exotic spaces (NBSP and friends) to
+# their ASCII forms before the scan sees them.
+_RESIDUAL_RE = re.compile(
+    "|".join(f"(?:{p})" for p in _SQL_INJECTION_PATTERNS),
+    re.IGNORECASE | re.ASCII,
+)
+_INJECTION_RE = re.compile(
+    "|".join([re.escape(lit) for lit in _SQL_INJECTION_LITERALS]
+             + [f"(?:{p})" for p in _SQL_INJECTION_PATTERNS]),
+    re.IGNORECASE | re.ASCII,
+)
+
+# Control/format categories stripped during normalization
+_DROP_CATEGORIES = frozenset(('Cc', 'Cf'))
+_CONTROL_TRANSLATE_TABLE = None
+
+def _control_translate_table():
+    """Translate table deleting every Cc/Cf codepoint (a few thousand
+    entries). Built lazily on the first non-ASCII input — walking the
+    full codepoint space costs a visible fraction of a second, and
+    ASCII-only processes never need it."""
+    global _CONTROL_TRANSLATE_TABLE
+    if _CONTROL_TRANSLATE_TABLE is None:
+        _CONTROL_TRANSLATE_TABLE = {
+            cp: None for cp in range(0x110000)
+            if unicodedata.category(chr(cp)) in _DROP_CATEGORIES
+        }
+    return _CONTROL_TRANSLATE_TABLE
+
+if AHOCORASICK_AVAILABLE:
+    _AHO = ahocorasick.Automaton()
+    for _lit in _SQL_INJECTION_LITERALS:
+        _AHO.add_word(_lit, _lit)
+    _AHO.make_automaton()
+else:
+    _AHO = None
+
+
+# Per-field allowlists. The pattern strings are the single source of
+# truth — the Pydantic models reuse them via StringConstraints — and the
+# compiled forms live here so hot validators skip re's internal cache
+# lookup (and its eviction) on every request.
+USERNAME_PATTERN = r'^[a-zA-Z0-9_]{3,20}$'
+TICKER_PATTERN = r'^[A-Za-z][A-Za-z0-9.\-]{0,9}$'
+_USERNAME_RE = re.compile(USERNAME_PATTERN)
+_TICKER_RE = re.compile(TICKER_PATTERN)
+
+# The validators are pure functions of the string, and the same values
+# recur constantly (usernames on every authenticated request, the same
+# few tickers on every backtest) — bounded memoization turns repeats
+# into dict lookups. maxsize caps growth on adversarial input.
+@lru_cache(maxsize=4096)
+def _scan_for_injection(text: str) -> bool:
+    if _AHO is not None:
+        # Literal fragments in one automaton pass, then the small
+        # structural residual; DFA-style, immune to backtracking
+        for _ in _AHO.iter(text.lower()):
+            return True
+        return _RESIDUAL_RE.search(text) is not None
+    return _INJECTION_RE.search(text) is not None
+
+@lru_cache(maxsize=4096)
+def _normalize_non_ascii(value: str) -> str:
+    # NFKC, not NFC: compatibility folding is what maps fullwidth
+    # letters and non-breaking spaces onto the ASCII the scan targets
+    normalized = unicodedata.normalize('NFKC', value)
+    # One C-level translate pass instead of a per-character
+    # unicodedata.category call driving a generator
+    return normalized.translate(_control_translate_table())
+
+
+class SQLDataValidator:
+    """Screens user-supplied strings for SQL-injection payloads."""
+
+    def detect_sql_injection(self, text: str) -> bool:
+        """True if the text contains a known injection fragment.
+
+        Oversized input counts as a hit before the scan (and before the
+        memoization cache) ever sees it.
+        """
+        if len(text) > _MAX_SCAN_LENGTH:
+            return True
+        return _scan_for_injection(text)
+
+    @staticmethod
+    def normalize_unicode(value: str) -> str:
+        """NFKC-normalize and strip control/format characters.
+
+        Keeps codepoint tricks (fullwidth keywords, NBSP-separated
+        tokens, zero-width joiners spliced into keywords) from slipping
+        past the scan. Pure-ASCII input — the overwhelmingly common
+        case for usernames and tickers — short-circuits before any
+        unicodedata work: NFKC is a no-op there and no ASCII character
+        is in a dropped category.
+        """
+        if value.isascii():
+            return value
+        return _normalize_non_ascii(value)
+
+    def validate_field(self, value: str, field_name: str = "input") -> str:
+        """Return the normalized value, or raise ValueError on a hit."""
+        if not value:
+            return value
+        if len(value) > _MAX_SCAN_LENGTH:
+            # Before normalization, not just before the scan: an
+            # oversized non-ASCII payload would otherwise still pay the
+            # full NFKC + translate pass and pin its result in the
+            # normalization lru_cache.
+            raise ValueError(f"Rejected potentially dangerous {field_name}")
+        if value.isascii() and value.isalnum():
+            # Pure alphanumeric ASCII: no quotes, comments or whitespace,
+            # so none of the multi-token injection structures can occur —
+            # a bare keyword on its own is harmless data. Skips both the
+            # normalization and the scan for the overwhelmingly common
+            # case without touching the memoization caches.
+            return value
+        value = self.normalize_unicode(value)
+        if self.detect_sql_injection(value):
+            raise ValueError(f"Rejected potentially dangerous {field_name}")
+        return value
+
+    def validate_username(self, value: str) -> str:
+        """Allowlisted username: 3-20 word characters.
+
+        The allowlist is the whole check: its charset admits no SQL
+        metacharacter and no non-ASCII codepoint, so the injection scan
+        and unicode normalization could never change the verdict.
+        """
+        if _USERNAME_RE.match(value) is None:
+            raise ValueError("Username must be 3-20 letters, digits or underscores")
+        return value
+
+    def validate_ticker(self, value: str) -> str:
+        """Allowlisted ticker symbol (letters plus digits, '.', '-').
+
+        Unlike the username charset, this one contains '-', so '--' (a
+        comment marker) can slip through the shape check — the injection
+        scan stays on after the allowlist.
+        """
+        if _TICKER_RE.match(value) is None:
+            raise ValueError("Ticker must be 1-10 symbol characters")
+        if self.detect_sql_injection(value):
+            raise ValueError("Rejected potentially dangerous ticker")
+        return value
@@ -3,10 +3,14 @@ import json
 
 BASE_URL = "http://127.0.0.1:8000"
 
+# One pooled session: reuses the TCP connection (and skips per-call
+# Session construction) across the flow instead of handshaking per call
+SESSION = requests.Session()
+
 def test_full_flow():
     print("1. Logging in...")
     # This uses the mock login
-    login_resp = requests.post(f"{BASE_URL}/token", data={"username": "testuser", "password": "password"})
+    login_resp = SESSION.post(f"{BASE_URL}/token", data={"username": "testuser", "password": "password"})
     if login_resp.status_code != 200:
         print(f"Login failed: {login_resp.text}")
         return
@@ -30,12 +34,12 @@ def test_full_flow():
         }
     }
     
-    resp = requests.post(f"{BASE_URL}/backtest", json=payload, headers=headers)
+    resp = SESSION.post(f"{BASE_URL}/backtest", json=payload, headers=headers)
     
     if resp.status_code == 200:
         data = resp.json()
         print(f"   Success! Final Capital: ${data['final_capital']:.2f}")
-        print(f"   Trades: {len(data['trades'])}")
+        print(f"   Trades: {len(data['trades']['prices'])}")
     else:
         print(f"   Failed: {resp.status_code}")
         print(f"   Response: {resp.text}")
@@ -24,19 +24,22 @@ def run_simulation():
     print("🧠 Creating SMA crossover strategy (5/20)...")
     strategy = SimpleStrategy(short_window=5, long_window=20)
     
-    # Generate signals
+    # Generate signals (SoA fast path: arrays end to end)
     print("📈 Generating trading signals...")
-    signals = strategy.generate_signals(data)
+    cols = strategy.generate_signals_arrays(
+        [row['Close'] for row in data],
+        [row['Date'] for row in data]
+    )
     
     # Count signals
-    buy_signals = sum(1 for s in signals if s['signal'] == 1)
-    sell_signals = sum(1 for s in signals if s['signal'] == -1)
+    buy_signals = int((cols['signal'] == 1).sum())
+    sell_signals = int((cols['signal'] == -1).sum())
     print(f"✓ Generated {buy_signals} BUY and {sell_signals} SELL signals")
     
     # Run backtest
     print("💰 Running backtest...")
     backtester = SimpleBacktester(initial_capital=10000)
-    results = backtester.run(signals)
+    results = backtester.run_arrays(cols['price'], cols['signal'], cols['date'])
     
     # Show results
     print("\n" + "=" * 50)